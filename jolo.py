@@ -8,24 +8,20 @@ Pronounced "yolo" in Norwegian. Close enough.
 """
 
 import argparse
-import json
+import errno
+import functools
+import io
 import os
-import random
 import shlex
 import shutil
 import socket
 import subprocess
 import sys
+import threading
 import tomllib
+from collections.abc import Iterator
 from pathlib import Path
 
-try:
-    import argcomplete
-
-    HAVE_ARGCOMPLETE = True
-except ImportError:
-    HAVE_ARGCOMPLETE = False
-
 # Word lists for random name generation
 ADJECTIVES = [
     "brave",
@@ -64,6 +60,7 @@ DEFAULT_CONFIG = {
         "codex": "codex",
     },
     "base_port": 4000,
+    "spawn_concurrency": 8,
 }
 
 # Port range for dev servers
@@ -73,9 +70,16 @@ PORT_MAX = 5000
 # Global verbose flag
 VERBOSE = False
 
+# Host paths that can't change during a run; resolved once at import.
+# (cwd is not cached: run modes chdir into the project.)
+_HOME = Path.home()
+_TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+
 
 def random_port() -> int:
     """Pick a random port in the PORT_MIN-PORT_MAX range."""
+    import random
+
     return random.randint(PORT_MIN, PORT_MAX)
 
 
@@ -97,6 +101,8 @@ def detect_hostname() -> str:
     2. Tailscale DNS name via `tailscale status --self --json`
     3. Falls back to "localhost"
     """
+    import json
+
     env_host = os.environ.get("DEV_HOST")
     if env_host:
         return env_host
@@ -119,11 +125,14 @@ def detect_hostname() -> str:
 
 def read_port_from_devcontainer(workspace_dir: Path) -> int | None:
     """Read the PORT from an existing devcontainer.json, if present."""
+    import json
+
     devcontainer_json = workspace_dir / ".devcontainer" / "devcontainer.json"
     if not devcontainer_json.exists():
         return None
     try:
-        config = json.loads(devcontainer_json.read_text())
+        with open(devcontainer_json, "rb") as f:
+            config = json.load(f)
         port_str = config.get("containerEnv", {}).get("PORT")
         return int(port_str) if port_str else None
     except (json.JSONDecodeError, ValueError, TypeError):
@@ -133,6 +142,9 @@ def read_port_from_devcontainer(workspace_dir: Path) -> int | None:
 # Valid languages for --lang flag
 VALID_LANGUAGES = frozenset(["python", "go", "typescript", "rust", "shell", "prose", "other"])
 
+# Sorted, comma-separated VALID_LANGUAGES for error messages
+_VALID_LANGUAGES_STR = ", ".join(sorted(VALID_LANGUAGES))
+
 # Language options for interactive selector (display names)
 LANGUAGE_OPTIONS = ["Python", "Go", "TypeScript", "Rust", "Shell", "Prose/Docs", "Other"]
 
@@ -205,44 +217,36 @@ PRECOMMIT_HOOKS = {
 }
 
 
-def _format_hook_yaml(hook: dict, indent: str = "        ") -> str:
-    """Format a single hook as YAML.
+def _write_hook_yaml(buf: io.StringIO, hook: dict, indent: str = "        ") -> None:
+    """Write a single hook as YAML.
 
     Args:
+        buf: Buffer to write the YAML lines to
         hook: Hook configuration dict with 'id' and optional other keys
         indent: Indentation string for the hook
-
-    Returns:
-        YAML-formatted hook string
     """
-    lines = [f"{indent}- id: {hook['id']}"]
+    buf.write(f"{indent}- id: {hook['id']}\n")
     if "args" in hook:
         args_str = ", ".join(hook["args"])
-        lines.append(f"{indent}  args: [{args_str}]")
+        buf.write(f"{indent}  args: [{args_str}]\n")
     if "additional_dependencies" in hook:
         deps = hook["additional_dependencies"]
         deps_str = ", ".join(f'"{d}"' for d in deps)
-        lines.append(f"{indent}  additional_dependencies: [{deps_str}]")
-    return "\n".join(lines)
+        buf.write(f"{indent}  additional_dependencies: [{deps_str}]\n")
 
 
-def _format_repo_yaml(repo_config: dict) -> str:
-    """Format a single repo configuration as YAML.
+def _write_repo_yaml(buf: io.StringIO, repo_config: dict) -> None:
+    """Write a single repo configuration as YAML.
 
     Args:
+        buf: Buffer to write the YAML lines to
         repo_config: Repo configuration dict with 'repo', 'rev', and 'hooks'
-
-    Returns:
-        YAML-formatted repo string
     """
-    lines = [
-        f"  - repo: {repo_config['repo']}",
-        f"    rev: {repo_config['rev']}",
-        "    hooks:",
-    ]
+    buf.write(f"  - repo: {repo_config['repo']}\n")
+    buf.write(f"    rev: {repo_config['rev']}\n")
+    buf.write("    hooks:\n")
     for hook in repo_config["hooks"]:
-        lines.append(_format_hook_yaml(hook))
-    return "\n".join(lines)
+        _write_hook_yaml(buf, hook)
 
 
 def generate_precommit_config(languages: list[str]) -> str:
@@ -296,20 +300,56 @@ def generate_precommit_config(languages: list[str]) -> str:
                 added_repos.add(hook_config["repo"])
 
     # Generate YAML output
-    lines = ["repos:"]
+    buf = io.StringIO()
+    buf.write("repos:\n")
     for repo in repos:
-        lines.append(_format_repo_yaml(repo))
-
-    return "\n".join(lines) + "\n"
-
-
-def get_precommit_install_command() -> list[str]:
-    """Get the command to install pre-commit hooks.
-
-    Returns:
-        List of command parts: ['pre-commit', 'install']
-    """
-    return ['pre-commit', 'install']
+        _write_repo_yaml(buf, repo)
+
+    return buf.getvalue()
+
+
+# tsconfig.json for TypeScript projects, kept pre-serialized so json isn't
+# needed at import time
+_TSCONFIG_JSON = """\
+{
+  "compilerOptions": {
+    "strict": true,
+    "noEmit": true,
+    "target": "ES2022",
+    "module": "NodeNext",
+    "moduleResolution": "NodeNext",
+    "esModuleInterop": true,
+    "skipLibCheck": true,
+    "forceConsistentCasingInFileNames": true
+  },
+  "include": [
+    "**/*.ts",
+    "**/*.tsx"
+  ],
+  "exclude": [
+    "node_modules",
+    "dist"
+  ]
+}"""
+
+# Type checker configs by language. Go and Rust have built-in type checking,
+# shell/prose/other have none, so they are absent from the table.
+_TYPE_CHECKER_CONFIGS = {
+    "python": {
+        # ty (by Astral, the ruff folks) configuration
+        "config_file": "pyproject.toml",
+        "config_content": """\
+[tool.ty]
+# ty type checker configuration
+# See: https://github.com/astral-sh/ty
+""",
+    },
+    "typescript": {
+        # tsconfig.json with strict mode
+        "config_file": "tsconfig.json",
+        "config_content": _TSCONFIG_JSON,
+    },
+}
 
 
 def get_type_checker_config(language: str) -> dict | None:
@@ -325,42 +365,29 @@ def get_type_checker_config(language: str) -> dict | None:
         dict with 'config_file' and 'config_content' keys, or None if no
         external type checker config is needed.
     """
-    if language == "python":
-        # ty (by Astral, the ruff folks) configuration
-        config_content = """\
-[tool.ty]
-# ty type checker configuration
-# See: https://github.com/astral-sh/ty
-"""
-        return {
-            "config_file": "pyproject.toml",
-            "config_content": config_content,
-        }
+    config = _TYPE_CHECKER_CONFIGS.get(language)
+    return dict(config) if config is not None else None
 
-    elif language == "typescript":
-        # tsconfig.json with strict mode
-        tsconfig = {
-            "compilerOptions": {
-                "strict": True,
-                "noEmit": True,
-                "target": "ES2022",
-                "module": "NodeNext",
-                "moduleResolution": "NodeNext",
-                "esModuleInterop": True,
-                "skipLibCheck": True,
-                "forceConsistentCasingInFileNames": True,
-            },
-            "include": ["**/*.ts", "**/*.tsx"],
-            "exclude": ["node_modules", "dist"],
-        }
-        return {
-            "config_file": "tsconfig.json",
-            "config_content": json.dumps(tsconfig, indent=2),
-        }
 
-    # Go and Rust have built-in type checking, no external config needed
-    # Shell, prose, other have no type checking
-    return None
+# Coverage configs by language. Shell, prose, other, and unknown languages
+# have no standard coverage and fall back to _EMPTY_COVERAGE_CONFIG.
+_COVERAGE_CONFIGS = {
+    "python": {
+        "config_addition": """\
+[tool.pytest.ini_options]
+addopts = "--cov=src --cov-report=term-missing"
+""",
+        "run_command": "pytest --cov=src --cov-report=term-missing",
+    },
+    # Bun has built-in coverage support
+    "typescript": {"config_addition": None, "run_command": "bun test --coverage"},
+    # Go has built-in coverage support
+    "go": {"config_addition": None, "run_command": "go test -cover ./..."},
+    # Rust uses cargo-llvm-cov for coverage
+    "rust": {"config_addition": None, "run_command": "cargo llvm-cov"},
+}
+
+_EMPTY_COVERAGE_CONFIG = {"config_addition": None, "run_command": None}
 
 
 def get_coverage_config(language: str) -> dict:
@@ -377,42 +404,7 @@ def get_coverage_config(language: str) -> dict:
             - 'config_addition': Config to add to project config file, or None
             - 'run_command': Command to run coverage, or None
     """
-    if language == "python":
-        config_addition = """\
-[tool.pytest.ini_options]
-addopts = "--cov=src --cov-report=term-missing"
-"""
-        return {
-            "config_addition": config_addition,
-            "run_command": "pytest --cov=src --cov-report=term-missing",
-        }
-
-    elif language == "typescript":
-        # Bun has built-in coverage support
-        return {
-            "config_addition": None,
-            "run_command": "bun test --coverage",
-        }
-
-    elif language == "go":
-        # Go has built-in coverage support
-        return {
-            "config_addition": None,
-            "run_command": "go test -cover ./...",
-        }
-
-    elif language == "rust":
-        # Rust uses cargo-llvm-cov for coverage
-        return {
-            "config_addition": None,
-            "run_command": "cargo llvm-cov",
-        }
-
-    # Shell, prose, other, and unknown languages have no standard coverage
-    return {
-        "config_addition": None,
-        "run_command": None,
-    }
+    return dict(_COVERAGE_CONFIGS.get(language, _EMPTY_COVERAGE_CONFIG))
 
 
 def get_justfile_content(language: str, project_name: str) -> str:
@@ -556,24 +548,13 @@ def get_motd_content(language: str, project_name: str) -> str:
 """
 
 
-def get_test_framework_config(language: str) -> dict:
-    """Get test framework configuration for a language.
-
-    Returns configuration for setting up test frameworks based on language.
-    For languages with built-in testing (Go, Rust), config_file is None.
-
-    Args:
-        language: The programming language (python, typescript, go, rust, etc.)
-
-    Returns:
-        dict with keys:
-            - 'config_file': File name for test config, or None for built-in testing
-            - 'config_content': Content to write/append to config file
-            - 'example_test_file': Path to example test file
-            - 'example_test_content': Content for example test file
-    """
-    if language == "python":
-        config_content = """\
+# Test framework configs by language. Shell, prose, other, and unknown
+# languages have no standard test framework and fall back to
+# _EMPTY_TEST_FRAMEWORK_CONFIG.
+_TEST_FRAMEWORK_CONFIGS = {
+    "python": {
+        "config_file": "pyproject.toml",
+        "config_content": """\
 [project]
 name = "{{PROJECT_NAME}}"
 version = "0.1.0"
@@ -596,8 +577,17 @@ pythonpath = ["src"]
 python_files = ["test_*.py", "*_test.py"]
 python_functions = ["test_*"]
 addopts = "-v --tb=short"
-"""
-        main_content = '''\
+""",
+        "example_test_file": "tests/test_main.py",
+        "example_test_content": '''\
+from {{PROJECT_NAME_UNDERSCORE}}.main import hello
+
+
+def test_hello():
+    assert hello() == "Hello, World!"
+''',
+        "main_file": "src/{{PROJECT_NAME_UNDERSCORE}}/main.py",
+        "main_content": '''\
 def hello() -> str:
     return "Hello, World!"
 
@@ -608,28 +598,16 @@ def main() -> None:
 
 if __name__ == "__main__":
     main()
-'''
-        example_test_content = '''\
-from {{PROJECT_NAME_UNDERSCORE}}.main import hello
-
-
-def test_hello():
-    assert hello() == "Hello, World!"
-'''
-        return {
-            "config_file": "pyproject.toml",
-            "config_content": config_content,
-            "example_test_file": "tests/test_main.py",
-            "example_test_content": example_test_content,
-            "main_file": "src/{{PROJECT_NAME_UNDERSCORE}}/main.py",
-            "main_content": main_content,
-            "init_file": "src/{{PROJECT_NAME_UNDERSCORE}}/__init__.py",
-            "tests_init_file": "tests/__init__.py",
-        }
-
-    elif language == "typescript":
-        # Bun has built-in test runner, no config file needed
-        example_test_content = """\
+''',
+        "init_file": "src/{{PROJECT_NAME_UNDERSCORE}}/__init__.py",
+        "tests_init_file": "tests/__init__.py",
+    },
+    # Bun has built-in test runner, no config file needed
+    "typescript": {
+        "config_file": None,
+        "config_content": "# Bun has built-in testing. Run tests with: bun test",
+        "example_test_file": "src/example.test.ts",
+        "example_test_content": """\
 import { describe, it, expect } from 'bun:test';
 
 describe('Example tests', () => {
@@ -646,17 +624,14 @@ describe('Example tests', () => {
     expect(result).toBe('HELLO');
   });
 });
-"""
-        return {
-            "config_file": None,
-            "config_content": "# Bun has built-in testing. Run tests with: bun test",
-            "example_test_file": "src/example.test.ts",
-            "example_test_content": example_test_content,
-        }
-
-    elif language == "go":
-        # Go has built-in testing, no external dependencies needed
-        example_test_content = """\
+""",
+    },
+    # Go has built-in testing, no external dependencies needed
+    "go": {
+        "config_file": None,
+        "config_content": "# Go uses built-in testing. Run tests with: go test ./...",
+        "example_test_file": "example_test.go",
+        "example_test_content": """\
 package main
 
 import "testing"
@@ -680,14 +655,9 @@ func TestStringOperations(t *testing.T) {
 \t\tt.Errorf("expected hello, got %s", result)
 \t}
 }
-"""
-        return {
-            "config_file": None,
-            "config_content": "# Go uses built-in testing. Run tests with: go test ./...",
-            "example_test_file": "example_test.go",
-            "example_test_content": example_test_content,
-            "main_file": "main.go",
-            "main_content": """\
+""",
+        "main_file": "main.go",
+        "main_content": """\
 package main
 
 import "fmt"
@@ -696,12 +666,14 @@ func main() {
 \tfmt.Println("Hello, world!")
 }
 """,
-        }
-
-    elif language == "rust":
-        # Rust has built-in testing, no config file needed
-        # Write to src/main.rs so cargo init creates a binary crate (not lib)
-        example_test_content = """\
+    },
+    # Rust has built-in testing, no config file needed
+    # Write to src/main.rs so cargo init creates a binary crate (not lib)
+    "rust": {
+        "config_file": None,
+        "config_content": "# Rust uses built-in testing. Run tests with: cargo test",
+        "example_test_file": "src/main.rs",
+        "example_test_content": """\
 fn main() {
     println!("Hello, world!");
 }
@@ -725,27 +697,42 @@ mod tests {
         assert_eq!(result, "HELLO");
     }
 }
-"""
-        return {
-            "config_file": None,
-            "config_content": "# Rust uses built-in testing. Run tests with: cargo test",
-            "example_test_file": "src/main.rs",
-            "example_test_content": example_test_content,
-        }
+""",
+    },
+}
 
-    # Shell, prose, other, and unknown languages have no standard test framework
-    return {
-        "config_file": None,
-        "config_content": "",
-        "example_test_file": None,
-        "example_test_content": "",
-    }
+_EMPTY_TEST_FRAMEWORK_CONFIG = {
+    "config_file": None,
+    "config_content": "",
+    "example_test_file": None,
+    "example_test_content": "",
+}
+
+
+def get_test_framework_config(language: str) -> dict:
+    """Get test framework configuration for a language.
+
+    Returns configuration for setting up test frameworks based on language.
+    For languages with built-in testing (Go, Rust), config_file is None.
+
+    Args:
+        language: The programming language (python, typescript, go, rust, etc.)
+
+    Returns:
+        dict with keys:
+            - 'config_file': File name for test config, or None for built-in testing
+            - 'config_content': Content to write/append to config file
+            - 'example_test_file': Path to example test file
+            - 'example_test_content': Content for example test file
+    """
+    return dict(_TEST_FRAMEWORK_CONFIGS.get(language, _EMPTY_TEST_FRAMEWORK_CONFIG))
 
 
 def verbose_print(msg: str) -> None:
     """Print message if verbose mode is enabled."""
-    if VERBOSE:
-        print(f"[verbose] {msg}", file=sys.stderr)
+    if not VERBOSE:
+        return
+    print(f"[verbose] {msg}", file=sys.stderr)
 
 
 def _select_languages_gum() -> list[str]:
@@ -820,14 +807,32 @@ def parse_lang_arg(value: str) -> list[str]:
     languages = [lang.strip() for lang in value.split(",")]
     invalid = [lang for lang in languages if lang not in VALID_LANGUAGES]
     if invalid:
-        valid_list = ", ".join(sorted(VALID_LANGUAGES))
         raise argparse.ArgumentTypeError(
             f"Invalid language(s): {', '.join(invalid)}. "
-            f"Valid options: {valid_list}"
+            f"Valid options: {_VALID_LANGUAGES_STR}"
         )
     return languages
 
 
+# Project init commands by language. "{project_name}" in any argument is
+# substituted at lookup time. Unknown languages fall back to _DEFAULT_INIT_COMMANDS.
+_INIT_COMMANDS = {
+    # pyproject.toml is created during scaffolding, just ensure tests dir exists
+    "python": (("mkdir", "-p", "tests"),),
+    "typescript": (
+        ("bun", "init"),
+        ("mkdir", "-p", "src"),
+        ("mv", "index.ts", "src/index.ts"),
+    ),
+    "go": (("go", "mod", "init", "{project_name}"),),
+    "rust": (("cargo", "init", "--name", "{project_name}"),),
+    "shell": (("mkdir", "-p", "src"),),
+    "prose": (("mkdir", "-p", "docs"),),
+}
+
+_DEFAULT_INIT_COMMANDS = (("mkdir", "-p", "src"),)
+
+
 def get_project_init_commands(language: str, project_name: str) -> list[list[str]]:
     """Get initialization commands for a project based on language.
 
@@ -841,28 +846,14 @@ def get_project_init_commands(language: str, project_name: str) -> list[list[str
     Returns:
         List of command lists, e.g. [['uv', 'init'], ['mkdir', '-p', 'tests']]
     """
-    commands: list[list[str]] = []
+    return [
+        [project_name if part == "{project_name}" else part for part in cmd]
+        for cmd in _INIT_COMMANDS.get(language, _DEFAULT_INIT_COMMANDS)
+    ]
 
-    if language == "python":
-        # pyproject.toml is created during scaffolding, just ensure tests dir exists
-        commands.append(["mkdir", "-p", "tests"])
-    elif language == "typescript":
-        commands.append(["bun", "init"])
-        commands.append(["mkdir", "-p", "src"])
-        commands.append(["mv", "index.ts", "src/index.ts"])
-    elif language == "go":
-        commands.append(["go", "mod", "init", project_name])
-    elif language == "rust":
-        commands.append(["cargo", "init", "--name", project_name])
-    elif language == "shell":
-        commands.append(["mkdir", "-p", "src"])
-    elif language == "prose":
-        commands.append(["mkdir", "-p", "docs"])
-    else:
-        # Default fallback for 'other' or unknown languages
-        commands.append(["mkdir", "-p", "src"])
 
-    return commands
+# Command to install pre-commit hooks inside the container
+PRECOMMIT_INSTALL_CMD = ("pre-commit", "install")
 
 
 def get_precommit_install_command() -> list[str]:
@@ -872,7 +863,7 @@ def get_precommit_install_command() -> list[str]:
         A list of strings representing the command to run pre-commit install.
         This will be executed via devcontainer exec in the wiring phase.
     """
-    return ["pre-commit", "install"]
+    return list(PRECOMMIT_INSTALL_CMD)
 
 
 def get_agent_command(config: dict, agent_name: str | None = None, index: int = 0) -> str:
@@ -963,22 +954,16 @@ def parse_copy(arg: str, project_name: str) -> dict:
 
     Returns dict with keys: source, target
     """
-    if ":" in arg:
-        # Split on first colon only (in case target has colons)
-        parts = arg.split(":", 1)
-        source = parts[0]
-        target = parts[1]
-    else:
-        source = arg
-        target = None
+    # Split on first colon only (in case target has colons)
+    source, sep, target = arg.partition(":")
 
     # Expand ~ in source
     source = os.path.expanduser(source)
 
     # Resolve target
-    if target is None:
-        # Use basename of source
-        target = f"/workspaces/{project_name}/{Path(source).name}"
+    if not sep:
+        # Use basename of source (plain string op, no Path needed)
+        target = f"/workspaces/{project_name}/{os.path.basename(source.rstrip('/'))}"
     elif not target.startswith("/"):
         # Relative target - prepend workspace
         target = f"/workspaces/{project_name}/{target}"
@@ -987,23 +972,38 @@ def parse_copy(arg: str, project_name: str) -> dict:
 
 
 def verbose_cmd(cmd: list[str]) -> None:
-    """Print command if verbose mode is enabled."""
-    if VERBOSE:
-        print(f'[verbose] $ {" ".join(cmd)}', file=sys.stderr)
+    """Print command if verbose mode is enabled.
+
+    Arguments are shell-quoted so the printed line can be copy-pasted.
+    """
+    if not VERBOSE:
+        return
+    print(f"[verbose] $ {shlex.join(cmd)}", file=sys.stderr)
+
+
+def _run_quiet(cmd: list[str], cwd: Path | None = None) -> int:
+    """Run a command whose output is never shown; returns its exit status.
+
+    Output goes to /dev/null instead of through pipes we would only discard.
+    """
+    verbose_cmd(cmd)
+    return subprocess.run(cmd, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode
 
 
-def load_config(global_config_dir: Path | None = None) -> dict:
+def load_config(global_config_dir: Path | None = None, project_dir: Path | None = None) -> dict:
     """Load configuration from TOML files.
 
     Config is loaded in order (later overrides earlier):
     1. Default config
     2. Global config: ~/.config/jolo/config.toml
-    3. Project config: .jolo.toml in current directory
+    3. Project config: .jolo.toml in project_dir (default: current directory)
     """
     config = DEFAULT_CONFIG.copy()
 
     if global_config_dir is None:
-        global_config_dir = Path.home() / ".config" / "jolo"
+        global_config_dir = _HOME / ".config" / "jolo"
+    if project_dir is None:
+        project_dir = Path.cwd()
 
     # Load global config
     global_config_file = global_config_dir / "config.toml"
@@ -1013,7 +1013,7 @@ def load_config(global_config_dir: Path | None = None) -> dict:
             config.update(global_cfg)
 
     # Load project config
-    project_config_file = Path.cwd() / ".jolo.toml"
+    project_config_file = project_dir / ".jolo.toml"
     if project_config_file.exists():
         with open(project_config_file, "rb") as f:
             project_cfg = tomllib.load(f)
@@ -1062,6 +1062,8 @@ def build_devcontainer_json(project_name: str, port: int | None = None) -> str:
         project_name: Name of the project/container
         port: Port number for dev servers (random in 4000-5000 if not specified)
     """
+    import json
+
     if port is None:
         port = random_port()
 
@@ -1123,9 +1125,78 @@ def preprocess_argv(argv: list[str]) -> list[str]:
     return argv
 
 
-def parse_args(argv: list[str]) -> argparse.Namespace:
-    """Parse command-line arguments."""
-    argv = preprocess_argv(argv)
+# Command flags (subcommands are rewritten to these by preprocess_argv).
+# Each entry is (flags, add_argument kwargs); help is always suppressed.
+_COMMAND_ARG_SPECS = (
+    (("--create",), {"metavar": "NAME"}),
+    (("--tree",), {"nargs": "?", "const": "", "default": None, "metavar": "NAME"}),
+    (("--spawn",), {"type": int, "metavar": "N"}),
+    (("--list",), {"action": "store_true"}),
+    (("--stop",), {"action": "store_true"}),
+    (("--attach",), {"action": "store_true"}),
+    (("--init",), {"action": "store_true"}),
+    (("--sync",), {"action": "store_true"}),
+    (("--prune",), {"action": "store_true"}),
+    (("--destroy",), {"action": "store_true"}),
+    (("--open",), {"action": "store_true"}),
+    (("--start",), {"action": "store_true"}),
+)
+
+# Option flags, in --help order. Each entry is (flags, add_argument kwargs).
+_OPTION_ARG_SPECS = (
+    (("--prompt", "-p"), {
+        "metavar": "PROMPT",
+        "help": "Start AI agent with this prompt (implies --detach)",
+    }),
+    (("--agent",), {
+        "default": "claude",
+        "metavar": "CMD",
+        "help": "AI agent command (default: claude)",
+    }),
+    (("--from",), {
+        "dest": "from_branch",
+        "metavar": "BRANCH",
+        "help": "Create worktree from specified branch",
+    }),
+    (("--prefix",), {
+        "metavar": "NAME",
+        "help": "Prefix for spawn worktree names (feat → feat-1, feat-2, ...)",
+    }),
+    (("--all", "-a"), {
+        "action": "store_true",
+        "help": "With list: all globally. With stop: all for project",
+    }),
+    (("--new",), {"action": "store_true", "help": "Remove existing container before starting"}),
+    (("--detach", "-d"), {"action": "store_true", "help": "Start container without attaching"}),
+    (("--shell",), {"action": "store_true", "help": "Exec into container with zsh (no tmux)"}),
+    (("--run",), {"metavar": "CMD", "help": "Exec command directly in container (no tmux)"}),
+    (("--mount",), {
+        "action": "append",
+        "default": [],
+        "metavar": "SRC:DST[:ro]",
+        "help": "Mount host path into container (repeatable)",
+    }),
+    (("--copy",), {
+        "action": "append",
+        "default": [],
+        "metavar": "SRC[:DST]",
+        "help": "Copy file to workspace before start (repeatable)",
+    }),
+    (("--lang",), {
+        "type": parse_lang_arg,
+        "default": None,
+        "metavar": "LANG[,...]",
+        "help": "Project language(s): python, go, typescript, rust, shell, prose, other",
+    }),
+    (("--yes", "-y"), {"action": "store_true", "help": "Skip confirmation prompts"}),
+    (("--verbose", "-v"), {"action": "store_true", "help": "Print commands being executed"}),
+    (("-h", "--help"), {"action": "help", "help": "Show this help message and exit"}),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the jolo argument parser once; parse_args() reuses it."""
     parser = argparse.ArgumentParser(
         prog="jolo",
         usage="jolo [command] [options] [path]",
@@ -1153,116 +1224,12 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     )
 
     # Commands use SUPPRESS for internal argparse flags, shown manually via description
-    cmds.add_argument("--create", metavar="NAME", help=argparse.SUPPRESS)
-    cmds.add_argument(
-        "--tree", nargs="?", const="", default=None, metavar="NAME",
-        help=argparse.SUPPRESS,
-    )
-    cmds.add_argument("--spawn", type=int, metavar="N", help=argparse.SUPPRESS)
-    cmds.add_argument("--list", action="store_true", help=argparse.SUPPRESS)
-    cmds.add_argument("--stop", action="store_true", help=argparse.SUPPRESS)
-    cmds.add_argument("--attach", action="store_true", help=argparse.SUPPRESS)
-    cmds.add_argument("--init", action="store_true", help=argparse.SUPPRESS)
-    cmds.add_argument("--sync", action="store_true", help=argparse.SUPPRESS)
-    cmds.add_argument("--prune", action="store_true", help=argparse.SUPPRESS)
-    cmds.add_argument("--destroy", action="store_true", help=argparse.SUPPRESS)
-    cmds.add_argument("--open", action="store_true", help=argparse.SUPPRESS)
-    cmds.add_argument("--start", action="store_true", help=argparse.SUPPRESS)
+    for flags, kwargs in _COMMAND_ARG_SPECS:
+        cmds.add_argument(*flags, help=argparse.SUPPRESS, **kwargs)
 
     opts = parser.add_argument_group("options")
-
-    opts.add_argument(
-        "--prompt",
-        "-p",
-        metavar="PROMPT",
-        help="Start AI agent with this prompt (implies --detach)",
-    )
-
-    opts.add_argument(
-        "--agent",
-        default="claude",
-        metavar="CMD",
-        help="AI agent command (default: claude)",
-    )
-
-    opts.add_argument(
-        "--from",
-        dest="from_branch",
-        metavar="BRANCH",
-        help="Create worktree from specified branch",
-    )
-
-    opts.add_argument(
-        "--prefix",
-        metavar="NAME",
-        help="Prefix for spawn worktree names (feat → feat-1, feat-2, ...)",
-    )
-
-    opts.add_argument(
-        "--all",
-        "-a",
-        action="store_true",
-        help="With list: all globally. With stop: all for project",
-    )
-
-    opts.add_argument(
-        "--new", action="store_true", help="Remove existing container before starting"
-    )
-
-    opts.add_argument(
-        "--detach", "-d", action="store_true", help="Start container without attaching"
-    )
-
-    opts.add_argument(
-        "--shell",
-        action="store_true",
-        help="Exec into container with zsh (no tmux)",
-    )
-
-    opts.add_argument(
-        "--run",
-        metavar="CMD",
-        help="Exec command directly in container (no tmux)",
-    )
-
-    opts.add_argument(
-        "--mount",
-        action="append",
-        default=[],
-        metavar="SRC:DST[:ro]",
-        help="Mount host path into container (repeatable)",
-    )
-
-    opts.add_argument(
-        "--copy",
-        action="append",
-        default=[],
-        metavar="SRC[:DST]",
-        help="Copy file to workspace before start (repeatable)",
-    )
-
-    opts.add_argument(
-        "--lang",
-        type=parse_lang_arg,
-        default=None,
-        metavar="LANG[,...]",
-        help="Project language(s): python, go, typescript, rust, shell, prose, other",
-    )
-
-    opts.add_argument(
-        "--yes",
-        "-y",
-        action="store_true",
-        help="Skip confirmation prompts",
-    )
-
-    opts.add_argument(
-        "--verbose", "-v", action="store_true", help="Print commands being executed"
-    )
-
-    opts.add_argument(
-        "-h", "--help", action="help", help="Show this help message and exit"
-    )
+    for flags, kwargs in _OPTION_ARG_SPECS:
+        opts.add_argument(*flags, **kwargs)
 
     parser.add_argument(
         "path",
@@ -1270,9 +1237,23 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         default=None,
         help=argparse.SUPPRESS,
     )
+    return parser
 
-    if HAVE_ARGCOMPLETE:
-        argcomplete.autocomplete(parser)
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    argv = preprocess_argv(argv)
+    parser = _build_parser()
+
+    # Shell completion request: argcomplete prints candidates and exits before
+    # any config/container work. Only import it when the shell is asking.
+    if "_ARGCOMPLETE" in os.environ:
+        try:
+            import argcomplete
+        except ImportError:
+            pass
+        else:
+            argcomplete.autocomplete(parser)
 
     args = parser.parse_args(argv)
     args._parser = parser
@@ -1285,35 +1266,55 @@ def check_tmux_guard() -> None:
         sys.exit("Error: Already in tmux session. Nested tmux not supported.")
 
 
+@functools.lru_cache(maxsize=8)
+def _find_git_root_cached(start: str) -> str | None:
+    """Walk up from a resolved start path to the nearest dir containing .git."""
+    current = start
+    while True:
+        # .git is a directory in a normal repo, a file in a worktree
+        if os.path.exists(os.path.join(current, ".git")):
+            return current
+        parent = os.path.dirname(current)
+        if parent == current:
+            # Checked the filesystem root too
+            return None
+        current = parent
+
+
 def find_git_root(start_path: Path | None = None) -> Path | None:
     """Find git repository root by traversing up from start_path.
 
-    Returns None if not in a git repository.
+    Returns None if not in a git repository. Results are memoized per
+    resolved start path; call _find_git_root_cached.cache_clear() after
+    creating a repository (git init).
     """
-    if start_path is None:
-        start_path = Path.cwd()
-
-    current = Path(start_path).resolve()
-
-    while current != current.parent:
-        if (current / ".git").exists():
-            return current
-        current = current.parent
-
-    # Check root directory too
-    if (current / ".git").exists():
-        return current
-
-    return None
+    start = os.path.realpath(os.getcwd() if start_path is None else start_path)
+    root = _find_git_root_cached(start)
+    return Path(root) if root is not None else None
 
 
 def generate_random_name() -> str:
     """Generate random adjective-noun name for worktree."""
+    import random
+
     adj = random.choice(ADJECTIVES)
     noun = random.choice(NOUNS)
     return f"{adj}-{noun}"
 
 
+def generate_random_names(count: int) -> list[str]:
+    """Generate up to count distinct adjective-noun names in one draw.
+
+    Samples without replacement from all adjective/noun pairs, so there is no
+    collision retry loop. Returns fewer names if count exceeds the pairs.
+    """
+    import random
+
+    pairs = len(ADJECTIVES) * len(NOUNS)
+    picks = random.sample(range(pairs), min(count, pairs))
+    return [f"{ADJECTIVES[p // len(NOUNS)]}-{NOUNS[p % len(NOUNS)]}" for p in picks]
+
+
 def clear_directory_contents(path: Path) -> None:
     """Remove all contents of a directory without removing the directory itself.
 
@@ -1321,11 +1322,76 @@ def clear_directory_contents(path: Path) -> None:
     """
     if not path.exists():
         return
-    for item in path.iterdir():
-        if item.is_dir():
-            shutil.rmtree(item)
-        else:
-            item.unlink()
+    # DirEntry caches d_type, so no extra stat per entry. Symlinks are
+    # unlinked, never followed.
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
+# Linux FICLONE ioctl: share extents copy-on-write (Btrfs, XFS, bcachefs)
+FICLONE = 0x40049409
+
+# Flipped off once a clone fails because the filesystem can't do it (see
+# _REFLINK_UNSUPPORTED_ERRNOS), so the rest of a tree copy goes straight to copy2
+_REFLINK_SUPPORTED = sys.platform == "linux"
+
+# errnos from FICLONE meaning "cloning isn't possible here", as opposed to a
+# problem with this particular file (EACCES, ENOENT, EISDIR, ...)
+_REFLINK_UNSUPPORTED_ERRNOS = frozenset({errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.EXDEV})
+
+
+def reflink_copy(src: str, dst: str) -> str:
+    """Copy a file as a reflink when the filesystem supports it.
+
+    Intended as a copytree copy_function. A reflink is a real copy (writes to
+    dst never reach src) that costs O(1) instead of O(file size). Falls back
+    to shutil.copy2 when cloning isn't possible. Never hardlinks, since the
+    container copy must stay isolated from the host.
+    """
+    global _REFLINK_SUPPORTED
+
+    if _REFLINK_SUPPORTED:
+        import fcntl
+
+        try:
+            # Opening dst truncates it before the ioctl; if the clone then
+            # fails, copy2 below rewrites dst in full
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError as e:
+            # Any other error is left for copy2 to retry or report
+            if e.errno in _REFLINK_UNSUPPORTED_ERRNOS:
+                # Racy under concurrent spawn prep, but only ever flips to False
+                _REFLINK_SUPPORTED = False
+
+    return shutil.copy2(src, dst)
+
+
+def tree_fingerprint(root: Path) -> str:
+    """Hash the path, type, size and mtime of every entry under root.
+
+    Any file added, removed, edited or touched changes the result; file
+    contents are not read. Symlinks are recorded by target, not followed.
+    """
+    import hashlib
+    import stat
+
+    digest = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(dirnames + filenames):
+            path = os.path.join(dirpath, name)
+            st = os.lstat(path)
+            target = os.readlink(path) if stat.S_ISLNK(st.st_mode) else ""
+            rel = os.path.relpath(path, root)
+            digest.update(f"{rel}\0{st.st_mode}\0{st.st_size}\0{st.st_mtime_ns}\0{target}\n".encode())
+    return digest.hexdigest()
 
 
 def setup_emacs_config(workspace_dir: Path) -> None:
@@ -1335,8 +1401,12 @@ def setup_emacs_config(workspace_dir: Path) -> None:
     has an isolated, writable copy of the config. Package directories
     (elpaca, tree-sitter) are in ~/.cache/emacs-container/ on the host,
     separate from the host's ~/.cache/emacs/ to avoid version/libc mismatches.
+
+    The copy is skipped only when both the host config and the existing copy
+    still match the tree_fingerprints recorded after the last copy, so edits
+    made to the copy from inside the container are undone on the next run.
     """
-    home = Path.home()
+    home = _HOME
     emacs_src = home / ".config" / "emacs"
     emacs_dst = workspace_dir / ".devcontainer" / ".emacs-config"
     cache_dst = workspace_dir / ".devcontainer" / ".emacs-cache"
@@ -1355,12 +1425,29 @@ def setup_emacs_config(workspace_dir: Path) -> None:
     (container_cache / "elpaca").mkdir(parents=True, exist_ok=True)
     (container_cache / "tree-sitter").mkdir(parents=True, exist_ok=True)
 
-    # Copy entire config directory, preserving the directory itself for bind mounts
+    # Nothing to do if neither the host config nor the copy has changed since
+    # the last copy. The stamp is inside the bind-mounted workspace, so it is
+    # only a cache hint, not protection against a container that rewrites it.
+    stamp = workspace_dir / ".devcontainer" / ".emacs-config.stamp"
+    src_fingerprint = tree_fingerprint(emacs_src)
+    if emacs_dst.is_dir():
+        try:
+            recorded_src, _, recorded_dst = stamp.read_text().partition("\n")
+        except FileNotFoundError:
+            recorded_src = recorded_dst = None
+        if recorded_src == src_fingerprint and recorded_dst == tree_fingerprint(emacs_dst):
+            verbose_print("Emacs config unchanged, skipping copy")
+            return
+
+    # Copy entire config directory, preserving the directory itself for bind mounts.
+    # Files are reflinked where the filesystem allows; otherwise copy2 -> copyfile
+    # uses the kernel fast path (sendfile on Linux, fcopyfile on macOS).
     if emacs_dst.exists():
         clear_directory_contents(emacs_dst)
-        shutil.copytree(emacs_src, emacs_dst, symlinks=True, dirs_exist_ok=True)
-    else:
-        shutil.copytree(emacs_src, emacs_dst, symlinks=True)
+    shutil.copytree(
+        emacs_src, emacs_dst, symlinks=True, dirs_exist_ok=True, copy_function=reflink_copy
+    )
+    stamp.write_text(f"{src_fingerprint}\n{tree_fingerprint(emacs_dst)}")
 
 
 def setup_credential_cache(workspace_dir: Path) -> None:
@@ -1373,7 +1460,7 @@ def setup_credential_cache(workspace_dir: Path) -> None:
     Note: We clear contents rather than rmtree to preserve directory inodes,
     which keeps bind mounts working in running containers.
     """
-    home = Path.home()
+    home = _HOME
 
     # Claude credentials
     claude_cache = workspace_dir / ".devcontainer" / ".claude-cache"
@@ -1388,12 +1475,13 @@ def setup_credential_cache(workspace_dir: Path) -> None:
         if src.exists():
             shutil.copy2(src, claude_cache / filename)
 
+    # claude_cache was just cleared, so statsig_dst never exists here.
+    # Reflink rather than hardlink: the cache is mounted read-write, and a
+    # hardlink would let the container modify the host's statsig files.
     statsig_src = claude_dir / "statsig"
     statsig_dst = claude_cache / "statsig"
     if statsig_src.exists():
-        if statsig_dst.exists():
-            shutil.rmtree(statsig_dst)
-        shutil.copytree(statsig_src, statsig_dst)
+        shutil.copytree(statsig_src, statsig_dst, copy_function=reflink_copy)
 
     claude_json_src = home / ".claude.json"
     claude_json_dst = workspace_dir / ".devcontainer" / ".claude.json"
@@ -1414,6 +1502,23 @@ def setup_credential_cache(workspace_dir: Path) -> None:
             shutil.copy2(src, gemini_cache / filename)
 
 
+def _copy_if_changed(src: Path, dst: Path) -> bool:
+    """Copy src to dst unless dst already has the same size and mtime.
+
+    copy2 preserves mtime, so a matching pair means dst is a previous copy.
+    Returns True if the file was copied.
+    """
+    try:
+        s = os.stat(src)
+        d = os.stat(dst)
+    except FileNotFoundError:
+        d = None
+    if d is not None and s.st_size == d.st_size and s.st_mtime == d.st_mtime:
+        return False
+    shutil.copy2(src, dst)
+    return True
+
+
 def copy_template_files(target_dir: Path) -> None:
     """Copy template files to the target directory.
 
@@ -1425,7 +1530,7 @@ def copy_template_files(target_dir: Path) -> None:
 
     Prints a warning if templates/ directory doesn't exist but continues.
     """
-    templates_dir = Path(__file__).resolve().parent / "templates"
+    templates_dir = _TEMPLATES_DIR
 
     if not templates_dir.exists():
         print(f"Warning: Templates directory not found: {templates_dir}", file=sys.stderr)
@@ -1435,9 +1540,7 @@ def copy_template_files(target_dir: Path) -> None:
 
     for filename in template_files:
         src = templates_dir / filename
-        if src.exists():
-            dst = target_dir / filename
-            shutil.copy2(src, dst)
+        if src.exists() and _copy_if_changed(src, target_dir / filename):
             verbose_print(f"Copied template: {filename}")
 
 
@@ -1518,6 +1621,22 @@ def sync_devcontainer(
     print(f"Synced .devcontainer/ with current config")
 
 
+def _pass_show(pass_path: str) -> str | None:
+    """Read a secret from pass. Returns None if unavailable."""
+    try:
+        result = subprocess.run(
+            ["pass", "show", pass_path],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (subprocess.TimeoutExpired, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
 def get_secrets(config: dict | None = None) -> dict[str, str]:
     """Get API secrets from pass or environment variables."""
     if config is None:
@@ -1529,22 +1648,19 @@ def get_secrets(config: dict | None = None) -> dict[str, str]:
     pass_available = shutil.which("pass") is not None
 
     if pass_available:
-        # Try to get secrets from pass using configured paths
-        for key, pass_path in [
-            ("ANTHROPIC_API_KEY", config["pass_path_anthropic"]),
-            ("OPENAI_API_KEY", config["pass_path_openai"]),
-        ]:
-            try:
-                result = subprocess.run(
-                    ["pass", "show", pass_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                if result.returncode == 0:
-                    secrets[key] = result.stdout.strip()
-            except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-                pass
+        # Try to get secrets from pass using configured paths. Each `pass show`
+        # forks gpg, so run them concurrently rather than back to back.
+        from concurrent.futures import ThreadPoolExecutor
+
+        pass_paths = {
+            "ANTHROPIC_API_KEY": config["pass_path_anthropic"],
+            "OPENAI_API_KEY": config["pass_path_openai"],
+        }
+        with ThreadPoolExecutor(max_workers=len(pass_paths)) as pool:
+            values = list(pool.map(_pass_show, pass_paths.values()))
+        for key, value in zip(pass_paths, values, strict=True):
+            if value is not None:
+                secrets[key] = value
 
     # Fallback to environment variables for any missing secrets
     for key in ["ANTHROPIC_API_KEY", "OPENAI_API_KEY"]:
@@ -1600,28 +1716,63 @@ def validate_init_mode() -> None:
         sys.exit("Error: Already in a git repository. Use jolo without --init.")
 
 
-def add_user_mounts(devcontainer_json_path: Path, mounts: list[dict]) -> None:
-    """Add user-specified mounts to devcontainer.json.
+def format_user_mount(mount: dict) -> str:
+    """Format a parsed --mount dict as a devcontainer.json mount string."""
+    mount_str = f"source={mount['source']},target={mount['target']},type=bind"
+    if mount["readonly"]:
+        mount_str += ",readonly"
+    return mount_str
+
+
+def merge_devcontainer_edits(
+    content: dict,
+    mounts: list[str],
+    container_env: dict[str, str] | None = None,
+) -> dict:
+    """Append mounts and set containerEnv variables on a devcontainer.json dict.
+
+    The dict is updated in place and returned.
+    """
+    if mounts:
+        content.setdefault("mounts", []).extend(mounts)
+    if container_env:
+        content.setdefault("containerEnv", {}).update(container_env)
+    return content
+
+
+def update_devcontainer_json(
+    devcontainer_json_path: Path,
+    mounts: list[str],
+    container_env: dict[str, str] | None = None,
+) -> None:
+    """Apply mount and containerEnv edits to devcontainer.json in a single read/write.
 
     Args:
         devcontainer_json_path: Path to devcontainer.json
-        mounts: List of mount dicts with keys: source, target, readonly
+        mounts: Mount strings to append to the "mounts" array
+        container_env: Variables to set in "containerEnv" (e.g. PORT)
     """
-    if not mounts:
+    import json
+
+    if not mounts and not container_env:
         return
 
-    content = json.loads(devcontainer_json_path.read_text())
+    with open(devcontainer_json_path, "rb") as f:
+        content = merge_devcontainer_edits(json.load(f), mounts, container_env)
+    # Keep indent=4: users edit this file by hand (PORT, mounts), and a
+    # compact dump would rewrite the whole file on every run
+    with open(devcontainer_json_path, "w", encoding="utf-8") as f:
+        json.dump(content, f, indent=4)
 
-    if "mounts" not in content:
-        content["mounts"] = []
 
-    for mount in mounts:
-        mount_str = f"source={mount['source']},target={mount['target']},type=bind"
-        if mount["readonly"]:
-            mount_str += ",readonly"
-        content["mounts"].append(mount_str)
+def add_user_mounts(devcontainer_json_path: Path, mounts: list[dict]) -> None:
+    """Add user-specified mounts to devcontainer.json.
 
-    devcontainer_json_path.write_text(json.dumps(content, indent=4))
+    Args:
+        devcontainer_json_path: Path to devcontainer.json
+        mounts: List of mount dicts with keys: source, target, readonly
+    """
+    update_devcontainer_json(devcontainer_json_path, [format_user_mount(m) for m in mounts])
 
 
 def copy_user_files(copies: list[dict], workspace_dir: Path) -> None:
@@ -1653,12 +1804,20 @@ def copy_user_files(copies: list[dict], workspace_dir: Path) -> None:
 
         # Create parent directories if needed
         target.parent.mkdir(parents=True, exist_ok=True)
+        # Copying onto a directory puts the file inside it, as cp/copy2 do
+        if target.is_dir():
+            target = target / source.name
 
-        # Copy file
-        shutil.copy2(source, target)
+        # Copy file (reflink on CoW filesystems, kernel-side copy otherwise)
+        reflink_copy(str(source), str(target))
         verbose_print(f"Copied {source} -> {target}")
 
 
+def worktree_git_mount(main_git_dir: Path) -> str:
+    """Mount string for the main repo's .git directory at the same absolute path."""
+    return f"source={main_git_dir},target={main_git_dir},type=bind"
+
+
 def add_worktree_git_mount(devcontainer_json_path: Path, main_git_dir: Path) -> None:
     """Add a mount for the main repo's .git directory to devcontainer.json.
 
@@ -1666,24 +1825,25 @@ def add_worktree_git_mount(devcontainer_json_path: Path, main_git_dir: Path) ->
     points to the main repo's .git/worktrees/NAME directory with an absolute
     path. We need to mount that path into the container.
     """
-    content = json.loads(devcontainer_json_path.read_text())
-
-    if "mounts" not in content:
-        content["mounts"] = []
-
-    # Mount the main .git directory at the same absolute path in the container
-    git_mount = f"source={main_git_dir},target={main_git_dir},type=bind"
-    content["mounts"].append(git_mount)
-
-    devcontainer_json_path.write_text(json.dumps(content, indent=4))
+    update_devcontainer_json(devcontainer_json_path, [worktree_git_mount(main_git_dir)])
 
 
 def is_container_running(workspace_dir: Path) -> bool:
     """Check if devcontainer for workspace is already running."""
     cmd = ["devcontainer", "exec", "--workspace-folder", str(workspace_dir), "true"]
-    verbose_cmd(cmd)
-    result = subprocess.run(cmd, capture_output=True, cwd=workspace_dir)
-    return result.returncode == 0
+    return _run_quiet(cmd, cwd=workspace_dir) == 0
+
+
+def ensure_file(path: Path) -> None:
+    """Create an empty file at path unless something already exists there.
+
+    Unlike Path.touch(), an existing file is left alone (no mtime update), and
+    the check and create are a single O_EXCL open.
+    """
+    try:
+        os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+    except FileExistsError:
+        pass
 
 
 def devcontainer_up(workspace_dir: Path, remove_existing: bool = False) -> bool:
@@ -1702,8 +1862,7 @@ def devcontainer_up(workspace_dir: Path, remove_existing: bool = False) -> bool:
         return False
 
     # Ensure histfile exists as a file (otherwise mount creates a directory)
-    histfile = workspace_dir / ".devcontainer" / ".histfile"
-    histfile.touch(exist_ok=True)
+    ensure_file(workspace_dir / ".devcontainer" / ".histfile")
 
     cmd = ["devcontainer", "up", "--workspace-folder", str(workspace_dir)]
 
@@ -1715,11 +1874,40 @@ def devcontainer_up(workspace_dir: Path, remove_existing: bool = False) -> bool:
     return result.returncode == 0
 
 
+# Characters that need a shell to interpret; commands without any of them
+# can be exec'd directly as an argv.
+_SHELL_METACHARS = frozenset("|&;<>()$`\\\"'*?[]#~=%{}!\n")
+
+
+# Shell builtins and keywords with no executable of the same name; commands
+# starting with one of these still go through sh -c.
+_SHELL_BUILTINS = frozenset({
+    ".", ":", "alias", "bg", "break", "case", "cd", "command", "continue",
+    "eval", "exec", "exit", "export", "fc", "fg", "for", "getopts", "hash",
+    "if", "jobs", "local", "read", "readonly", "return", "set", "shift",
+    "source", "times", "trap", "type", "ulimit", "umask", "unalias", "unset",
+    "until", "wait", "while",
+})
+
+
+def shell_free_argv(command: str) -> list[str] | None:
+    """Split a command into argv if it needs no shell, else return None."""
+    if any(c in _SHELL_METACHARS for c in command):
+        return None
+    argv = command.split()
+    if not argv or argv[0] in _SHELL_BUILTINS:
+        return None
+    return argv
+
+
 def devcontainer_exec_tmux(workspace_dir: Path) -> None:
     """Execute into container and attach/create tmux session."""
+    # The shell is needed for the $HOME/tmux-layout.sh check; both branches
+    # exec so it doesn't linger. new-session -A -D attaches (detaching other
+    # clients) if the session exists, else creates it.
     shell_cmd = (
         "if [ -x \"$HOME/tmux-layout.sh\" ]; then exec \"$HOME/tmux-layout.sh\"; "
-        "else tmux attach-session -d -t dev || tmux new-session -s dev; fi"
+        "else exec tmux new-session -A -D -s dev; fi"
     )
     cmd = [
         "devcontainer",
@@ -1736,15 +1924,18 @@ def devcontainer_exec_tmux(workspace_dir: Path) -> None:
 
 
 def devcontainer_exec_command(workspace_dir: Path, command: str) -> None:
-    """Execute a command directly in container (no tmux)."""
+    """Execute a command directly in container (no tmux).
+
+    Plain commands (no shell metacharacters) are exec'd as an argv; anything
+    else goes through sh -c.
+    """
+    argv = shell_free_argv(command) or ["sh", "-c", command]
     cmd = [
         "devcontainer",
         "exec",
         "--workspace-folder",
         str(workspace_dir),
-        "sh",
-        "-c",
-        command,
+        *argv,
     ]
 
     verbose_cmd(cmd)
@@ -1759,60 +1950,68 @@ def write_prompt_file(workspace_dir: Path, agent: str, prompt: str) -> None:
     (devcontainer_dir / ".agent-name").write_text(agent)
 
 
-def list_worktrees(git_root: Path) -> list[tuple[Path, str, str]]:
-    """List git worktrees for a repository.
+def _worktree_entry(fields: dict[str, str]) -> tuple[Path, str, str]:
+    """Build a (path, commit, branch) tuple from one porcelain worktree block."""
+    return (
+        Path(fields.get("worktree", "")),
+        fields.get("HEAD", "")[:7],
+        fields.get("branch", "").replace("refs/heads/", ""),
+    )
 
-    Returns list of tuples: (path, commit, branch)
+
+# Porcelain attributes kept per worktree; others (bare, detached, locked...) are ignored
+_WT_KEYS = frozenset({"worktree", "HEAD", "branch"})
+
+
+def iter_worktrees(git_root: Path) -> Iterator[tuple[Path, str, str]]:
+    """Yield git worktrees for a repository as (path, commit, branch) tuples.
+
+    Parses `git worktree list --porcelain` line by line as git writes it, so
+    callers that stop early don't wait for (or buffer) the whole listing.
+    Yields nothing if git_root is not a repository.
     """
-    result = subprocess.run(
+    with subprocess.Popen(
         ["git", "worktree", "list", "--porcelain"],
         cwd=git_root,
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         text=True,
-    )
+    ) as proc:
+        current_worktree = {}
+
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            if not line:
+                if current_worktree:
+                    yield _worktree_entry(current_worktree)
+                    current_worktree = {}
+                continue
 
-    if result.returncode != 0:
-        return []
+            key, sep, value = line.partition(" ")
+            if sep and key in _WT_KEYS:
+                current_worktree[key] = value
 
-    worktrees = []
-    current_worktree = {}
-
-    for line in result.stdout.strip().split("\n"):
-        if not line:
-            if current_worktree:
-                worktrees.append(
-                    (
-                        Path(current_worktree.get("worktree", "")),
-                        current_worktree.get("HEAD", "")[:7],
-                        current_worktree.get("branch", "").replace("refs/heads/", ""),
-                    )
-                )
-                current_worktree = {}
-            continue
+        # Don't forget last worktree
+        if current_worktree:
+            yield _worktree_entry(current_worktree)
 
-        if line.startswith("worktree "):
-            current_worktree["worktree"] = line[9:]
-        elif line.startswith("HEAD "):
-            current_worktree["HEAD"] = line[5:]
-        elif line.startswith("branch "):
-            current_worktree["branch"] = line[7:]
-
-    # Don't forget last worktree
-    if current_worktree:
-        worktrees.append(
-            (
-                Path(current_worktree.get("worktree", "")),
-                current_worktree.get("HEAD", "")[:7],
-                current_worktree.get("branch", "").replace("refs/heads/", ""),
-            )
-        )
 
-    return worktrees
+def list_worktrees(git_root: Path) -> list[tuple[Path, str, str]]:
+    """List git worktrees for a repository.
+
+    Returns list of tuples: (path, commit, branch)
+    """
+    return list(iter_worktrees(git_root))
 
 
-def find_project_workspaces(git_root: Path) -> list[tuple[Path, str]]:
+def find_project_workspaces(
+    git_root: Path, worktrees: list[tuple[Path, str, str]] | None = None
+) -> list[tuple[Path, str]]:
     """Find all workspace directories for a project.
 
+    Pass worktrees (a list_worktrees() result) if the caller already has it,
+    to avoid running `git worktree list` a second time.
+
     Returns list of tuples: (path, type) where type is 'main' or worktree name.
     """
     project_name = git_root.name
@@ -1821,7 +2020,8 @@ def find_project_workspaces(git_root: Path) -> list[tuple[Path, str]]:
     # Check for worktrees directory
     worktrees_dir = git_root.parent / f"{project_name}-worktrees"
     if worktrees_dir.exists():
-        worktrees = list_worktrees(git_root)
+        if worktrees is None:
+            worktrees = list_worktrees(git_root)
         for wt_path, _, branch in worktrees:
             if wt_path != git_root:
                 workspaces.append((wt_path, branch or wt_path.name))
@@ -1829,8 +2029,12 @@ def find_project_workspaces(git_root: Path) -> list[tuple[Path, str]]:
     return workspaces
 
 
+@functools.lru_cache(maxsize=1)
 def get_container_runtime() -> str | None:
-    """Detect available container runtime (docker or podman)."""
+    """Detect available container runtime (docker or podman).
+
+    Cached: the PATH lookup runs once per process.
+    """
     if shutil.which("docker"):
         return "docker"
     if shutil.which("podman"):
@@ -1838,15 +2042,106 @@ def get_container_runtime() -> str | None:
     return None
 
 
+# Field separator for `docker ps --format` output. ASCII unit separator can't
+# appear in container names or paths, unlike tab.
+_PS_FIELD_SEP = "\x1f"
+_PS_FORMAT = '{{.Names}}\x1f{{.Label "devcontainer.local_folder"}}\x1f{{.State}}'
+
+
+def _docker_context_active() -> bool:
+    """Return True if docker is pointed at a non-default context.
+
+    Checks DOCKER_CONTEXT, then currentContext in the CLI config
+    ($DOCKER_CONFIG/config.json, default ~/.docker/config.json).
+    """
+    import json
+
+    context = os.environ.get("DOCKER_CONTEXT")
+    if context is None:
+        config_dir = os.environ.get("DOCKER_CONFIG") or str(_HOME / ".docker")
+        try:
+            with open(os.path.join(config_dir, "config.json"), "rb") as f:
+                context = json.load(f).get("currentContext")
+        except (OSError, ValueError, AttributeError):
+            context = None
+    return bool(context) and context != "default"
+
+
+def engine_socket_path(runtime: str) -> str | None:
+    """Return the unix API socket the runtime CLI is explicitly pointed at, or None.
+
+    Only a unix:// DOCKER_HOST / CONTAINER_HOST is used. Without one, or with a
+    docker context / podman connection selected, the CLI may be talking to a
+    different daemon than any default socket, so listing is left to the CLI.
+    Remote hosts (tcp://, ssh://) are left to the CLI too.
+    """
+    if runtime == "docker":
+        host = os.environ.get("DOCKER_HOST")
+        if _docker_context_active():
+            return None
+    else:
+        host = os.environ.get("CONTAINER_HOST")
+        if os.environ.get("CONTAINER_CONNECTION"):
+            return None
+    if host and host.startswith("unix://"):
+        return host.removeprefix("unix://")
+    return None
+
+
+def _engine_api_get(socket_path: str, path: str, timeout: float = 2.0) -> object | None:
+    """GET path from a Docker-compatible engine API over a unix socket.
+
+    Returns the decoded JSON body, or None if the socket isn't reachable or
+    the request fails, so callers can fall back to the CLI.
+    """
+    import http.client
+    import json
+
+    class UnixHTTPConnection(http.client.HTTPConnection):
+        def connect(self) -> None:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.settimeout(timeout)
+            self.sock.connect(socket_path)
+
+    conn = UnixHTTPConnection("localhost", timeout=timeout)
+    try:
+        conn.request("GET", path)
+        response = conn.getresponse()
+        if response.status != 200:
+            return None
+        return json.load(response)
+    except (OSError, http.client.HTTPException, ValueError):
+        return None
+    finally:
+        conn.close()
+
+
+# /containers/json?all=1&filters={"label":["devcontainer.local_folder"]}
+_DEVCONTAINERS_API_PATH = "/containers/json?all=1&filters=%7B%22label%22%3A%5B%22devcontainer.local_folder%22%5D%7D"
+
+
 def list_all_devcontainers() -> list[tuple[str, str, str]]:
     """List all running devcontainers globally.
 
+    Asks the engine API socket directly when DOCKER_HOST / CONTAINER_HOST
+    names a reachable one (no process spawn), otherwise runs `<runtime> ps`.
+
     Returns list of tuples: (container_name, workspace_folder, status)
     """
     runtime = get_container_runtime()
     if runtime is None:
         return []
 
+    socket_path = engine_socket_path(runtime)
+    if socket_path and os.path.exists(socket_path):
+        listing = _engine_api_get(socket_path, _DEVCONTAINERS_API_PATH)
+        if isinstance(listing, list):
+            return [
+                (c["Names"][0].lstrip("/"), c["Labels"]["devcontainer.local_folder"], c["State"])
+                for c in listing
+                if c.get("Names") and "devcontainer.local_folder" in (c.get("Labels") or {})
+            ]
+
     # Query containers with devcontainer label
     result = subprocess.run(
         [
@@ -1856,7 +2151,7 @@ def list_all_devcontainers() -> list[tuple[str, str, str]]:
             "--filter",
             "label=devcontainer.local_folder",
             "--format",
-            '{{.Names}}\t{{.Label "devcontainer.local_folder"}}\t{{.State}}',
+            _PS_FORMAT,
         ],
         capture_output=True,
         text=True,
@@ -1866,13 +2161,11 @@ def list_all_devcontainers() -> list[tuple[str, str, str]]:
         return []
 
     containers = []
-    for line in result.stdout.strip().split("\n"):
-        if not line:
-            continue
-        parts = line.split("\t")
-        if len(parts) >= 3:
-            name, folder, state = parts[0], parts[1], parts[2]
-            containers.append((name, folder, state))
+    for line in result.stdout.splitlines():
+        # Known arity: one split, no per-field work
+        parts = line.split(_PS_FIELD_SEP, 2)
+        if len(parts) == 3:
+            containers.append(tuple(parts))
 
     return containers
 
@@ -1885,25 +2178,23 @@ def run_list_global_mode() -> None:
 
     containers = list_all_devcontainers()
 
-    print("Running devcontainers:")
-    print()
+    # Build the whole listing, then write it in one go
+    lines = ["Running devcontainers:", ""]
 
     running_containers = [(n, f, s) for n, f, s in containers if s == "running"]
 
     if not running_containers:
-        print("  (none)")
+        lines.append("  (none)")
     else:
-        for name, folder, _ in running_containers:
-            print(f"  {name:<24} {folder}")
+        lines.extend(f"  {name:<24} {folder}" for name, folder, _ in running_containers)
 
     # Also show stopped containers
     stopped_containers = [(n, f, s) for n, f, s in containers if s != "running"]
     if stopped_containers:
-        print()
-        print("Stopped devcontainers:")
-        print()
-        for name, folder, state in stopped_containers:
-            print(f"  {name:<24} {folder}  ({state})")
+        lines += ["", "Stopped devcontainers:", ""]
+        lines.extend(f"  {name:<24} {folder}  ({state})" for name, folder, state in stopped_containers)
+
+    print("\n".join(lines))
 
 
 def get_container_for_workspace(workspace_dir: Path) -> str | None:
@@ -1936,9 +2227,12 @@ def get_container_for_workspace(workspace_dir: Path) -> str | None:
     return result.stdout.strip().split("\n")[0]
 
 
-def stop_container(workspace_dir: Path) -> bool:
+def stop_container(workspace_dir: Path, container_name: str | None = None) -> bool:
     """Stop the devcontainer for a workspace.
 
+    If container_name is already known (e.g. from list_all_devcontainers),
+    the per-workspace container lookup is skipped.
+
     Returns True if stopped successfully, False otherwise.
     """
     runtime = get_container_runtime()
@@ -1949,7 +2243,8 @@ def stop_container(workspace_dir: Path) -> bool:
         )
         return False
 
-    container_name = get_container_for_workspace(workspace_dir)
+    if container_name is None:
+        container_name = get_container_for_workspace(workspace_dir)
     if container_name is None:
         print(f"No container found for {workspace_dir}", file=sys.stderr)
         return False
@@ -1980,16 +2275,35 @@ def run_stop_mode(args: argparse.Namespace) -> None:
         worktrees = [(p, t) for p, t in workspaces if t != "main"]
         main = [(p, t) for p, t in workspaces if t == "main"]
 
-        any_stopped = False
-        for ws_path, ws_type in worktrees + main:
-            # Skip if directory doesn't exist (stale worktree)
-            if not ws_path.exists():
-                continue
-            if is_container_running(ws_path):
-                if stop_container(ws_path):
-                    any_stopped = True
+        # One container listing covers every workspace, instead of an exec
+        # probe plus a ps lookup per workspace
+        containers = {
+            Path(folder): (name, state) for name, folder, state in list_all_devcontainers()
+        }
 
-        if not any_stopped:
+        def running(group: list[tuple[Path, str]]) -> list[tuple[Path, str]]:
+            # Skip stale worktrees (directory gone) and containers not running
+            return [
+                (ws_path, containers[ws_path][0])
+                for ws_path, _ in group
+                if ws_path.exists() and containers.get(ws_path, (None, None))[1] == "running"
+            ]
+
+        def stop(ws: tuple[Path, str]) -> bool:
+            return stop_container(ws[0], container_name=ws[1])
+
+        # Worktree containers are independent, so stop them concurrently;
+        # main is still stopped last
+        running_worktrees = running(worktrees)
+        results = []
+        if running_worktrees:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(8, len(running_worktrees))) as pool:
+                results.extend(pool.map(stop, running_worktrees))
+        results.extend(stop(ws) for ws in running(main))
+
+        if not any(results):
             print("No running containers found for this project")
     else:
         if not stop_container(git_root):
@@ -2064,18 +2378,60 @@ def remove_container(container_name: str) -> bool:
     if runtime is None:
         return False
 
-    cmd = [runtime, "rm", container_name]
-    verbose_cmd(cmd)
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    return result.returncode == 0
+    return _run_quiet([runtime, "rm", container_name]) == 0
+
+
+def _fast_rmtree(path: Path) -> None:
+    """Recursively delete path, preferring `rm -rf` over shutil.rmtree.
+
+    rm unlinks in C without a Python frame and stat per entry, which matters
+    for trees full of node_modules or build output. Falls back to
+    shutil.rmtree where rm is unavailable. Raises OSError on failure.
+    """
+    if os.name == "posix":
+        cmd = ["rm", "-rf", "--", str(path)]
+        verbose_cmd(cmd)
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+        except FileNotFoundError:
+            pass
+        else:
+            if result.returncode != 0:
+                raise OSError(result.stderr.strip() or f"rm exited with status {result.returncode}")
+            return
+    shutil.rmtree(path)
 
 
 def remove_worktree(git_root: Path, worktree_path: Path) -> bool:
     """Remove a git worktree."""
     cmd = ["git", "worktree", "remove", "--force", str(worktree_path)]
-    verbose_cmd(cmd)
-    result = subprocess.run(cmd, cwd=git_root, capture_output=True, text=True)
-    return result.returncode == 0
+    return _run_quiet(cmd, cwd=git_root) == 0
+
+
+def _format_prune_listing(
+    stopped_containers: list[tuple[str, str]],
+    orphan_containers: list[tuple[str, str]],
+    stale_worktrees: list[tuple[Path, str]] | None = None,
+) -> str:
+    """Format the prune candidates as one block of text (each section ends blank)."""
+    lines = []
+
+    if stopped_containers:
+        lines.append("Stopped containers:")
+        lines.extend(f"  {name:<24} {folder}" for name, folder in stopped_containers)
+        lines.append("")
+
+    if orphan_containers:
+        lines.append("Orphan containers (workspace dir missing):")
+        lines.extend(f"  {name:<24} {folder}" for name, folder in orphan_containers)
+        lines.append("")
+
+    if stale_worktrees:
+        lines.append("Stale worktrees:")
+        lines.extend(f"  {wt_path.name:<24} ({branch})" for wt_path, branch in stale_worktrees)
+        lines.append("")
+
+    return "".join(f"{line}\n" for line in lines)
 
 
 def run_prune_global_mode() -> None:
@@ -2097,17 +2453,7 @@ def run_prune_global_mode() -> None:
         print("Nothing to prune.")
         return
 
-    if stopped_containers:
-        print("Stopped containers:")
-        for name, folder in stopped_containers:
-            print(f"  {name:<24} {folder}")
-        print()
-
-    if orphan_containers:
-        print("Orphan containers (workspace dir missing):")
-        for name, folder in orphan_containers:
-            print(f"  {name:<24} {folder}")
-        print()
+    print(_format_prune_listing(stopped_containers, orphan_containers), end="")
 
     # Prompt for confirmation
     try:
@@ -2122,10 +2468,7 @@ def run_prune_global_mode() -> None:
 
     # Stop orphan containers first
     for name, _ in orphan_containers:
-        cmd = [runtime, "stop", name]
-        verbose_cmd(cmd)
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode == 0:
+        if _run_quiet([runtime, "stop", name]) == 0:
             print(f"Stopped: {name}")
         else:
             print(f"Failed to stop: {name}", file=sys.stderr)
@@ -2168,23 +2511,7 @@ def run_prune_mode(args: argparse.Namespace) -> None:
         return
 
     # Show what will be pruned
-    if stopped_containers:
-        print("Stopped containers:")
-        for name, folder in stopped_containers:
-            print(f"  {name:<24} {folder}")
-        print()
-
-    if orphan_containers:
-        print("Orphan containers (workspace dir missing):")
-        for name, folder in orphan_containers:
-            print(f"  {name:<24} {folder}")
-        print()
-
-    if stale_worktrees:
-        print("Stale worktrees:")
-        for wt_path, branch in stale_worktrees:
-            print(f"  {wt_path.name:<24} ({branch})")
-        print()
+    print(_format_prune_listing(stopped_containers, orphan_containers, stale_worktrees), end="")
 
     # Prompt for confirmation
     try:
@@ -2199,10 +2526,7 @@ def run_prune_mode(args: argparse.Namespace) -> None:
 
     # Stop orphan containers first
     for name, _ in orphan_containers:
-        cmd = [runtime, "stop", name]
-        verbose_cmd(cmd)
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode == 0:
+        if _run_quiet([runtime, "stop", name]) == 0:
             print(f"Stopped: {name}")
         else:
             print(f"Failed to stop: {name}", file=sys.stderr)
@@ -2222,6 +2546,10 @@ def run_prune_mode(args: argparse.Namespace) -> None:
             print(f"Failed to remove worktree: {wt_path.name}", file=sys.stderr)
 
 
+# Upper bound on a single `<runtime> stop` (the runtime's own grace period is 10s)
+_STOP_TIMEOUT = 60
+
+
 def run_destroy_mode(args: argparse.Namespace) -> None:
     """Run --destroy mode: stop and remove all containers for project."""
     # If path argument provided, use it; otherwise detect from cwd
@@ -2268,20 +2596,36 @@ def run_destroy_mode(args: argparse.Namespace) -> None:
             print("Cancelled.")
             return
 
-    # Stop running containers first
-    for name, folder, state in containers:
+    def stop_and_remove(container: tuple[str, str, str]) -> tuple[str | None, bool]:
+        """Stop (if running) and remove one container; returns (stop error, removed)."""
+        name, _, state = container
+        stop_error = None
         if state == "running":
             cmd = [runtime, "stop", name]
             verbose_cmd(cmd)
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"Stopped: {name}")
+            try:
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=_STOP_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                stop_error = f"timed out after {_STOP_TIMEOUT}s"
             else:
-                print(f"Failed to stop {name}: {result.stderr}", file=sys.stderr)
+                if result.returncode != 0:
+                    stop_error = result.stderr
+        return stop_error, remove_container(name)
 
-    # Remove all containers
-    for name, folder, state in containers:
-        if remove_container(name):
+    # Each container waits out its own stop grace period, so handle them
+    # concurrently and report in listing order once all are done
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(32, len(containers))) as pool:
+        results = list(pool.map(stop_and_remove, containers))
+
+    for (name, _, state), (stop_error, removed) in zip(containers, results, strict=True):
+        if state == "running":
+            if stop_error is None:
+                print(f"Stopped: {name}")
+            else:
+                print(f"Failed to stop {name}: {stop_error}", file=sys.stderr)
+        if removed:
             print(f"Removed: {name}")
         else:
             print(f"Failed to remove: {name}", file=sys.stderr)
@@ -2326,14 +2670,14 @@ def run_destroy_mode(args: argparse.Namespace) -> None:
             # gitdir points to .git/worktrees/<name>, go up to find main repo
             main_repo = Path(gitdir).parent.parent.parent
             # Get branch name for this worktree
-            for wt_path, _, branch in list_worktrees(main_repo):
+            for wt_path, _, branch in iter_worktrees(main_repo):
                 if wt_path.resolve() == git_root.resolve():
                     worktree_branch = branch
                     break
 
     for d in dirs_to_remove:
         try:
-            shutil.rmtree(d)
+            _fast_rmtree(d)
             print(f"Removed: {d}")
         except Exception as e:
             print(f"Failed to remove {d}: {e}", file=sys.stderr)
@@ -2341,7 +2685,7 @@ def run_destroy_mode(args: argparse.Namespace) -> None:
     # Clean up git worktree and branch if this was a worktree
     if main_repo and main_repo.exists():
         # Prune stale worktree entries
-        subprocess.run(["git", "worktree", "prune"], cwd=main_repo, capture_output=True)
+        _run_quiet(["git", "worktree", "prune"], cwd=main_repo)
         verbose_print("Pruned stale worktree entries")
 
         # Delete the branch if we found one (requires confirmation)
@@ -2491,16 +2835,22 @@ def run_list_mode(args: argparse.Namespace) -> None:
     print(f"Project: {project_name}")
     print()
 
-    # Find all workspaces
-    workspaces = find_project_workspaces(git_root)
+    # Find all workspaces; the worktree listing is reused for the section below
+    worktrees = list_worktrees(git_root)
+    workspaces = find_project_workspaces(git_root, worktrees=worktrees)
+
+    # Check container status for each, against one container listing rather
+    # than an exec probe per workspace
+    running_folders = {
+        Path(folder) for _, folder, state in list_all_devcontainers() if state == "running"
+    }
 
-    # Check container status for each
     print("Containers:")
     any_running = False
     for ws_path, ws_type in workspaces:
         devcontainer_dir = ws_path / ".devcontainer"
         if devcontainer_dir.exists():
-            running = is_container_running(ws_path)
+            running = ws_path in running_folders
             status = "running" if running else "stopped"
             status_marker = "*" if running else " "
             print(f"  {status_marker} {ws_path.name:<20} {status:<10} ({ws_type})")
@@ -2512,7 +2862,6 @@ def run_list_mode(args: argparse.Namespace) -> None:
     print()
 
     # List worktrees
-    worktrees = list_worktrees(git_root)
     if len(worktrees) > 1:  # More than just main repo
         print("Worktrees:")
         for wt_path, commit, branch in worktrees:
@@ -2592,10 +2941,10 @@ def run_default_mode(args: argparse.Namespace) -> None:
 
 def branch_exists(git_root: Path, branch: str) -> bool:
     """Check if a branch or ref exists in the repository."""
-    result = subprocess.run(
-        ["git", "rev-parse", "--verify", branch], cwd=git_root, capture_output=True
-    )
-    return result.returncode == 0
+    return _run_quiet(["git", "rev-parse", "--verify", branch], cwd=git_root) == 0
+
+
+_GIT_WORKTREE_LOCK = threading.Lock()
 
 
 def get_or_create_worktree(
@@ -2604,6 +2953,8 @@ def get_or_create_worktree(
     worktree_path: Path,
     config: dict | None = None,
     from_branch: str | None = None,
+    mounts: list[dict] | None = None,
+    container_env: dict[str, str] | None = None,
 ) -> Path:
     """Get existing worktree or create a new one.
 
@@ -2611,21 +2962,27 @@ def get_or_create_worktree(
     the path. If it doesn't exist, creates the worktree with devcontainer.
 
     If from_branch is specified, creates the worktree from that branch.
+    User mounts (parsed --mount dicts) and container_env are written to
+    devcontainer.json in the same rewrite as the worktree's .git mount.
     """
+    user_mounts = [format_user_mount(m) for m in mounts or []]
+
     if worktree_path.exists():
         print(f"Using existing worktree: {worktree_path}")
+        devcontainer_json = worktree_path / ".devcontainer" / "devcontainer.json"
+        if devcontainer_json.exists():
+            update_devcontainer_json(devcontainer_json, user_mounts, container_env)
         return worktree_path
 
-    # Create worktrees directory if needed
-    worktree_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Create git worktree with new branch
+    # Create git worktree with new branch (git creates the worktrees directory)
     cmd = ["git", "worktree", "add", "-b", worktree_name, str(worktree_path)]
     if from_branch:
         cmd.append(from_branch)
 
     verbose_cmd(cmd)
-    result = subprocess.run(cmd, cwd=git_root)
+    # git takes a lock on the repo for worktree add; serialize concurrent callers
+    with _GIT_WORKTREE_LOCK:
+        result = subprocess.run(cmd, cwd=git_root)
     if result.returncode != 0:
         sys.exit("Error: Failed to create git worktree")
 
@@ -2637,17 +2994,19 @@ def get_or_create_worktree(
         # Already checked out by git worktree (was committed to repo)
         pass
     elif src_devcontainer.exists():
-        # Copy from main repo (not committed, just local)
-        shutil.copytree(src_devcontainer, dst_devcontainer, symlinks=True)
+        # Copy from main repo (not committed, just local). Reflink, not
+        # hardlink: devcontainer.json is rewritten in place below
+        shutil.copytree(src_devcontainer, dst_devcontainer, symlinks=True, copy_function=reflink_copy)
     else:
         # Scaffold new .devcontainer
         container_name = get_container_name(str(git_root), worktree_name)
         scaffold_devcontainer(container_name, worktree_path, config=config)
 
-    # Add mount for main repo's .git directory so worktree git operations work
+    # Add mount for main repo's .git directory so worktree git operations work,
+    # together with any user mounts
     main_git_dir = git_root / ".git"
     devcontainer_json = dst_devcontainer / "devcontainer.json"
-    add_worktree_git_mount(devcontainer_json, main_git_dir)
+    update_devcontainer_json(devcontainer_json, [worktree_git_mount(main_git_dir)] + user_mounts, container_env)
 
     print(f"Created worktree: {worktree_path}")
     print(f"Branch: {worktree_name}")
@@ -2672,21 +3031,16 @@ def run_tree_mode(args: argparse.Namespace) -> None:
     # Load config
     config = load_config()
 
-    # Get or create the worktree
+    # Get or create the worktree, adding user-specified mounts to devcontainer.json
     worktree_path = get_or_create_worktree(
         git_root,
         worktree_name,
         worktree_path,
         config=config,
         from_branch=args.from_branch,
+        mounts=[parse_mount(m, worktree_name) for m in args.mount],
     )
 
-    # Add user-specified mounts to devcontainer.json
-    if args.mount:
-        parsed_mounts = [parse_mount(m, worktree_name) for m in args.mount]
-        devcontainer_json = worktree_path / ".devcontainer" / "devcontainer.json"
-        add_user_mounts(devcontainer_json, parsed_mounts)
-
     # Copy user-specified files
     if args.copy:
         parsed_copies = [parse_copy(c, worktree_name) for c in args.copy]
@@ -2843,6 +3197,7 @@ def run_create_mode(args: argparse.Namespace) -> None:
     result = subprocess.run(cmd, cwd=project_path)
     if result.returncode != 0:
         sys.exit("Error: Failed to initialize git repository")
+    _find_git_root_cached.cache_clear()
 
     # Scaffold .devcontainer
     scaffold_devcontainer(project_name, project_path, config=config)
@@ -2934,6 +3289,7 @@ def run_init_mode(args: argparse.Namespace) -> None:
     result = subprocess.run(cmd, cwd=project_path)
     if result.returncode != 0:
         sys.exit("Error: Failed to initialize git repository")
+    _find_git_root_cached.cache_clear()
 
     # Scaffold .devcontainer
     scaffold_devcontainer(project_name, project_path, config=config)
@@ -2999,6 +3355,59 @@ def run_init_mode(args: argparse.Namespace) -> None:
     devcontainer_exec_tmux(project_path)
 
 
+def tail_lines(path: Path, count: int, max_bytes: int = 8192) -> list[str]:
+    """Return the last count non-blank lines of a text file.
+
+    Only the final max_bytes are read, so a huge build log costs one seek
+    and a small read.
+    """
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - max_bytes))
+        lines = f.read().decode("utf-8", errors="replace").splitlines()
+    if size > max_bytes:
+        lines = lines[1:]  # first line is probably cut off
+    return [line.rstrip() for line in lines if line.strip()][-count:]
+
+
+def _prepare_spawn_worktree(
+    git_root: Path, name: str, port: int, config: dict, args: argparse.Namespace
+) -> Path:
+    """Create (or reuse) one spawn worktree and get it ready for `devcontainer up`.
+
+    Safe to run concurrently for different names: everything written lives
+    under that worktree, and the host-side sources are only read. Returns the
+    worktree path.
+    """
+    worktree_path = get_worktree_path(str(git_root), name)
+
+    # Create or get existing worktree; user-specified mounts and the port go
+    # into devcontainer.json in one rewrite
+    worktree_path = get_or_create_worktree(
+        git_root,
+        name,
+        worktree_path,
+        config=config,
+        from_branch=args.from_branch,
+        mounts=[parse_mount(m, name) for m in args.mount],
+        container_env={"PORT": str(port)},
+    )
+
+    # Copy user-specified files
+    if args.copy:
+        parsed_copies = [parse_copy(c, name) for c in args.copy]
+        copy_user_files(parsed_copies, worktree_path)
+
+    # Set up credentials and emacs config
+    setup_credential_cache(worktree_path)
+    setup_emacs_config(worktree_path)
+
+    # Ensure histfile exists (otherwise mount creates a directory)
+    ensure_file(worktree_path / ".devcontainer" / ".histfile")
+
+    return worktree_path
+
+
 def run_spawn_mode(args: argparse.Namespace) -> None:
     """Run --spawn mode: create N worktrees with containers and agents."""
     git_root = validate_tree_mode()
@@ -3012,101 +3421,59 @@ def run_spawn_mode(args: argparse.Namespace) -> None:
     base_port = config.get("base_port", 4000)
 
     # Generate worktree names (number prefix for sorting + uniqueness)
-    worktree_names = []
-    used_names = set()
-    for i in range(n):
-        idx = i + 1
-        if args.prefix:
-            name = f"{idx}-{args.prefix}"
-        else:
-            # Generate unique random name with number prefix
-            for _ in range(100):  # Max attempts
-                random_part = generate_random_name()
-                if random_part not in used_names:
-                    break
-            else:
-                random_part = f"spawn-{idx}"
-            used_names.add(random_part)
-            name = f"{idx}-{random_part}"
-        worktree_names.append(name)
+    if args.prefix:
+        worktree_names = [f"{idx}-{args.prefix}" for idx in range(1, n + 1)]
+    else:
+        # Unique random names, with spawn-N once the word pairs run out
+        random_parts = generate_random_names(n)
+        random_parts += [f"spawn-{idx}" for idx in range(len(random_parts) + 1, n + 1)]
+        worktree_names = [f"{idx}-{part}" for idx, part in enumerate(random_parts, 1)]
 
     print(f"Spawning {n} worktrees: {', '.join(worktree_names)}")
 
-    # Create worktrees and scaffold devcontainers
-    worktree_paths = []
-    for i, name in enumerate(worktree_names):
-        worktree_path = get_worktree_path(str(git_root), name)
-        port = base_port + i
-
-        # Create or get existing worktree
-        worktree_path = get_or_create_worktree(
-            git_root,
-            name,
-            worktree_path,
-            config=config,
-            from_branch=args.from_branch,
-        )
-
-        # Update devcontainer.json with correct port
-        devcontainer_json = worktree_path / ".devcontainer" / "devcontainer.json"
-        if devcontainer_json.exists():
-            content = json.loads(devcontainer_json.read_text())
-            if "containerEnv" not in content:
-                content["containerEnv"] = {}
-            content["containerEnv"]["PORT"] = str(port)
-            devcontainer_json.write_text(json.dumps(content, indent=4))
-
-        # Add user-specified mounts
-        if args.mount:
-            parsed_mounts = [parse_mount(m, name) for m in args.mount]
-            add_user_mounts(devcontainer_json, parsed_mounts)
+    # Create worktrees and scaffold devcontainers; the per-worktree prep is
+    # independent file I/O, so overlap it (results keep worktree_names order).
+    # Both this and the container start below honour spawn_concurrency.
+    from concurrent.futures import ThreadPoolExecutor, as_completed
 
-        # Copy user-specified files
-        if args.copy:
-            parsed_copies = [parse_copy(c, name) for c in args.copy]
-            copy_user_files(parsed_copies, worktree_path)
-
-        # Set up credentials and emacs config
-        setup_credential_cache(worktree_path)
-        setup_emacs_config(worktree_path)
-
-        # Ensure histfile exists (otherwise mount creates a directory)
-        histfile = worktree_path / ".devcontainer" / ".histfile"
-        histfile.touch(exist_ok=True)
-
-        worktree_paths.append(worktree_path)
+    max_workers = max(1, min(n, config.get("spawn_concurrency", 8)))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        worktree_paths = list(pool.map(
+            lambda i: _prepare_spawn_worktree(git_root, worktree_names[i], base_port + i, config, args),
+            range(n),
+        ))
 
     # Set up secrets in environment
     secrets = get_secrets(config)
     os.environ.update(secrets)
 
-    # Start containers in parallel
-    print(f"Starting {n} containers...")
-    processes = []
-    for i, path in enumerate(worktree_paths):
+    def start_container(path: Path) -> tuple[Path, int, Path]:
+        # Output goes straight to a log file rather than being held in memory
         cmd = ["devcontainer", "up", "--workspace-folder", str(path)]
         if args.new:
             cmd.append("--remove-existing-container")
         verbose_cmd(cmd)
-        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        processes.append((path, proc))
-        print(f"  [{i+1}/{n}] Launched: {path.name}")
-
-    # Wait for all containers to start
-    print(f"Waiting for {n} containers to be ready...")
+        log_path = path / ".devcontainer" / "up.log"
+        with open(log_path, "wb") as log:
+            result = subprocess.run(cmd, stdout=log, stderr=subprocess.STDOUT)
+        return path, result.returncode, log_path
+
+    # Start containers in parallel, capped so a large spawn doesn't swamp the
+    # container daemon; report each one as soon as it finishes
+    print(f"Starting {n} containers ({max_workers} at a time)...")
     failed = []
-    for path, proc in processes:
-        stdout, stderr = proc.communicate()
-        if proc.returncode != 0:
-            failed.append(path.name)
-            print(f"  Failed: {path.name}", file=sys.stderr)
-            if stderr:
-                # Show last few lines of error
-                err_lines = stderr.decode().strip().split('\n')
-                for line in err_lines[-5:]:
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(start_container, path) for path in worktree_paths]
+        for done, future in enumerate(as_completed(futures), 1):
+            path, returncode, log_path = future.result()
+            if returncode != 0:
+                failed.append(path.name)
+                print(f"  [{done}/{n}] Failed: {path.name} (log: {log_path})", file=sys.stderr)
+                # Show last few lines of output
+                for line in tail_lines(log_path, 5):
                     print(f"    {line}", file=sys.stderr)
-        else:
-            print(f"  Ready: {path.name}")
+            else:
+                print(f"  [{done}/{n}] Ready: {path.name}")
 
     if failed:
         print(f"Warning: {len(failed)} container(s) failed to start: {', '.join(failed)}")
@@ -3127,6 +3494,38 @@ def run_spawn_mode(args: argparse.Namespace) -> None:
     )
 
 
+def run_tmux_commands(commands: list[list[str]]) -> int:
+    """Run several tmux commands, chained with ';' into one tmux invocation.
+
+    tmux stops a chain at the first command that fails, so commands after a
+    failed one (e.g. windows after a failed new-session) are not run. Replaying
+    the chain one command at a time instead would repeat the commands that did
+    succeed, opening duplicate windows and sending agent commands twice.
+
+    Falls back to one invocation per command if an argument would be read as
+    a separator (tmux splits on arguments ending in ';') or the chained
+    command line is too long to exec.
+
+    Returns 0 on success, otherwise the last non-zero tmux exit status.
+    """
+    if not any(arg.endswith(";") for command in commands for arg in command):
+        chained = ["tmux"]
+        for command in commands:
+            if len(chained) > 1:
+                chained.append(";")
+            chained.extend(command)
+        try:
+            return subprocess.run(chained).returncode
+        except OSError as e:
+            if e.errno != errno.E2BIG:
+                raise
+
+    status = 0
+    for command in commands:
+        status = subprocess.run(["tmux", *command]).returncode or status
+    return status
+
+
 def spawn_tmux_multipane(
     worktree_paths: list[Path],
     worktree_names: list[str],
@@ -3163,21 +3562,21 @@ def spawn_tmux_multipane(
 
     quoted_prompt = shlex.quote(prompt)
 
-    # Build exec command using sh -c to properly handle agent flags
+    # Build exec command; plain agent commands run directly, anything needing
+    # a shell (aliases, env assignments, pipes) goes through sh -c
     def build_exec_cmd(path: Path, agent_cmd: str) -> str:
+        if shell_free_argv(agent_cmd):
+            return f"devcontainer exec --workspace-folder {path} {agent_cmd} {quoted_prompt}"
         inner_cmd = f"{agent_cmd} {quoted_prompt}"
         return f"devcontainer exec --workspace-folder {path} sh -c {shlex.quote(inner_cmd)}"
 
-    # Create new session with first window
+    # Create new session with first window, then additional windows (not
+    # panes - full screen each), each running its agent command
     first_exec_cmd = build_exec_cmd(first_path, first_agent_cmd)
-    subprocess.run([
-        "tmux", "new-session", "-d", "-s", session_name, "-n", worktree_names[0],
-    ])
-    subprocess.run([
-        "tmux", "send-keys", "-t", f"{session_name}:{worktree_names[0]}", first_exec_cmd, "Enter"
-    ])
-
-    # Create additional windows (not panes - full screen each)
+    tmux_commands = [
+        ["new-session", "-d", "-s", session_name, "-n", worktree_names[0]],
+        ["send-keys", "-t", f"{session_name}:{worktree_names[0]}", first_exec_cmd, "Enter"],
+    ]
     for i in range(1, n):
         path = worktree_paths[i]
         name = worktree_names[i]
@@ -3185,13 +3584,11 @@ def spawn_tmux_multipane(
 
         exec_cmd = build_exec_cmd(path, agent_cmd)
 
-        # Create new window (full screen) and send command
-        subprocess.run([
-            "tmux", "new-window", "-t", session_name, "-n", name
-        ])
-        subprocess.run([
-            "tmux", "send-keys", "-t", f"{session_name}:{name}", exec_cmd, "Enter"
-        ])
+        tmux_commands.append(["new-window", "-t", session_name, "-n", name])
+        tmux_commands.append(["send-keys", "-t", f"{session_name}:{name}", exec_cmd, "Enter"])
+
+    if run_tmux_commands(tmux_commands) != 0:
+        print("Warning: tmux session setup failed; some agent windows may be missing", file=sys.stderr)
 
     print(f"\nStarted {n} agents in tmux session '{session_name}'")
     print(f"Agents: {', '.join(get_agent_name(config, agent_override, i) for i in range(n))}")
@@ -1,9 +1,18 @@
 #!/usr/bin/env python3
 """Tests for jolo CLI tool - TDD style."""
 
+import atexit
+import errno
+import functools
+import json
 import os
+import re
+import shutil
+import socket
+import subprocess
 import sys
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 from unittest import mock
@@ -14,13 +23,62 @@ try:
 except ImportError:
     jolo = None
 
+# Keep every test's scratch directories under one root on tmpfs when there
+# is one, so the many small mkdir/write/rmtree calls stay in memory. Tests
+# pass dir=_TMPROOT explicitly rather than changing tempfile's global default.
+_TMPROOT = tempfile.mkdtemp(
+    prefix="jolo-tests-", dir="/dev/shm" if os.path.isdir("/dev/shm") else None
+)
+atexit.register(shutil.rmtree, _TMPROOT, ignore_errors=True)
+
+# Case-insensitive keywords expected in error exits
+_GIT_PAT = re.compile(r'(?i)git')
+_TMUX_PAT = re.compile(r'(?i)tmux')
+_EXISTS_PAT = re.compile(r'(?i)exists')
+
+
+def _completed(returncode, stdout='', stderr=''):
+    """A subprocess.run() result carrying a return code and captured output."""
+    return subprocess.CompletedProcess([], returncode, stdout, stderr)
+
+
+@functools.cache
+def default_args():
+    """jolo.parse_args([]), parsed once for the tests that only read defaults.
+
+    Every caller gets the same Namespace, so it must not be mutated.
+    """
+    return jolo.parse_args([])
+
+
+_GIT_FIXTURE = None
+
+
+def init_committed_repo(path):
+    """Make path a git repo with one commit (README), as the git tests expect.
+
+    The repo is built once per run, by a single shell, and copied into place
+    afterwards, saving five git subprocesses per test.
+    """
+    global _GIT_FIXTURE
+
+    if _GIT_FIXTURE is None:
+        fixture = tempfile.mkdtemp(dir=_TMPROOT)
+        subprocess.run(
+            ['sh', '-c', 'git init && git config user.email test@test.com && git config user.name Test'
+             ' && echo test > README && git add . && git commit -m Initial'],
+            cwd=fixture, capture_output=True,
+        )
+        _GIT_FIXTURE = fixture
+    shutil.copytree(_GIT_FIXTURE, path, symlinks=True, dirs_exist_ok=True)
+
 
 class TestArgumentParsing(unittest.TestCase):
     """Test command-line argument parsing."""
 
     def test_no_args_returns_default_mode(self):
         """No arguments should result in default mode."""
-        args = jolo.parse_args([])
+        args = default_args()
         self.assertIsNone(args.tree)
         self.assertIsNone(args.create)
         self.assertFalse(args.new)
@@ -69,9 +127,16 @@ class TestArgumentParsing(unittest.TestCase):
 
     def test_sync_default_false(self):
         """--sync should default to False."""
-        args = jolo.parse_args([])
+        args = default_args()
         self.assertFalse(args.sync)
 
+    def test_parser_is_reused_without_leaking_state(self):
+        """Repeated parses share one parser but not append defaults."""
+        first = jolo.parse_args(['--mount', '~/a:a'])
+        second = jolo.parse_args([])
+        self.assertIs(first._parser, second._parser)
+        self.assertEqual(second.mount, [])
+
 
 class TestGuards(unittest.TestCase):
     """Test guard conditions and validations."""
@@ -81,13 +146,11 @@ class TestGuards(unittest.TestCase):
         with mock.patch.dict(os.environ, {'TMUX': '/tmp/tmux-1000/default,12345,0'}):
             with self.assertRaises(SystemExit) as cm:
                 jolo.check_tmux_guard()
-            self.assertIn('tmux', str(cm.exception.code).lower())
+            self.assertRegex(str(cm.exception.code), _TMUX_PAT)
 
     def test_tmux_guard_passes_when_not_in_tmux(self):
         """Should pass when TMUX env var is not set."""
-        env = os.environ.copy()
-        env.pop('TMUX', None)
-        with mock.patch.dict(os.environ, env, clear=True):
+        with mock.patch.dict(os.environ, clear=True):
             # Should not raise
             jolo.check_tmux_guard()
 
@@ -96,13 +159,12 @@ class TestGitDetection(unittest.TestCase):
     """Test git repository detection."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory(dir=_TMPROOT))
         self.original_cwd = os.getcwd()
+        jolo._find_git_root_cached.cache_clear()
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-        shutil.rmtree(self.tmpdir)
 
     def test_find_git_root_at_root(self):
         """Should find git root when at repo root."""
@@ -131,10 +193,29 @@ class TestGitDetection(unittest.TestCase):
         result = jolo.find_git_root()
         self.assertIsNone(result)
 
+    def test_find_git_root_is_memoized(self):
+        """Repeated lookups from the same directory should not re-walk the tree."""
+        (Path(self.tmpdir) / '.git').mkdir()
+        subdir = Path(self.tmpdir) / 'a' / 'b'
+        subdir.mkdir(parents=True)
+
+        first = jolo.find_git_root(subdir)
+        with mock.patch('os.path.exists') as mock_exists:
+            second = jolo.find_git_root(subdir)
+            mock_exists.assert_not_called()
+
+        self.assertEqual(first, second)
+        self.assertEqual(first, Path(self.tmpdir).resolve())
+
 
 class TestRandomNameGeneration(unittest.TestCase):
     """Test random name generation for worktrees."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls._adj_set = frozenset(jolo.ADJECTIVES)
+        cls._noun_set = frozenset(jolo.NOUNS)
+
     def test_generate_random_name_format(self):
         """Should generate adjective-noun format."""
         name = jolo.generate_random_name()
@@ -145,8 +226,8 @@ class TestRandomNameGeneration(unittest.TestCase):
         """Generated name should use defined word lists."""
         name = jolo.generate_random_name()
         adj, noun = name.split('-')
-        self.assertIn(adj, jolo.ADJECTIVES)
-        self.assertIn(noun, jolo.NOUNS)
+        self.assertIn(adj, self._adj_set)
+        self.assertIn(noun, self._noun_set)
 
     def test_generate_random_name_is_random(self):
         """Should generate different names (probabilistically)."""
@@ -154,18 +235,32 @@ class TestRandomNameGeneration(unittest.TestCase):
         # With 10 adjectives and 10 nouns, getting same name 20 times is unlikely
         self.assertGreater(len(names), 1)
 
+    def test_generate_random_names_are_distinct(self):
+        """Batch names should be unique and drawn from the word lists."""
+        names = jolo.generate_random_names(30)
+        self.assertEqual(len(names), 30)
+        self.assertEqual(len(set(names)), 30)
+        for name in names:
+            adj, noun = name.split('-')
+            self.assertIn(adj, self._adj_set)
+            self.assertIn(noun, self._noun_set)
+
+    def test_generate_random_names_capped_at_pair_count(self):
+        """Asking for more names than pairs returns every pair once."""
+        total = len(jolo.ADJECTIVES) * len(jolo.NOUNS)
+        names = jolo.generate_random_names(total + 5)
+        self.assertEqual(len(set(names)), total)
+
 
 class TestTemplateSystem(unittest.TestCase):
     """Test .devcontainer template scaffolding."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory(dir=_TMPROOT))
         self.original_cwd = os.getcwd()
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-        shutil.rmtree(self.tmpdir)
 
     def test_scaffold_devcontainer_creates_directory(self):
         """Should create .devcontainer directory."""
@@ -173,13 +268,11 @@ class TestTemplateSystem(unittest.TestCase):
         jolo.scaffold_devcontainer('testproject')
 
         devcontainer_dir = Path(self.tmpdir) / '.devcontainer'
-        self.assertTrue(devcontainer_dir.exists())
         self.assertTrue(devcontainer_dir.is_dir())
 
     def test_scaffold_devcontainer_creates_json(self):
         """Should create devcontainer.json with project name."""
-        os.chdir(self.tmpdir)
-        jolo.scaffold_devcontainer('testproject')
+        jolo.scaffold_devcontainer('testproject', Path(self.tmpdir))
 
         json_file = Path(self.tmpdir) / '.devcontainer' / 'devcontainer.json'
         self.assertTrue(json_file.exists())
@@ -188,8 +281,7 @@ class TestTemplateSystem(unittest.TestCase):
 
     def test_scaffold_devcontainer_creates_dockerfile(self):
         """Should create Dockerfile with default base image."""
-        os.chdir(self.tmpdir)
-        jolo.scaffold_devcontainer('testproject')
+        jolo.scaffold_devcontainer('testproject', Path(self.tmpdir))
 
         dockerfile = Path(self.tmpdir) / '.devcontainer' / 'Dockerfile'
         self.assertTrue(dockerfile.exists())
@@ -198,9 +290,8 @@ class TestTemplateSystem(unittest.TestCase):
 
     def test_scaffold_devcontainer_uses_config_base_image(self):
         """Should use base_image from config."""
-        os.chdir(self.tmpdir)
         config = {'base_image': 'custom/myimage:v3'}
-        jolo.scaffold_devcontainer('testproject', config=config)
+        jolo.scaffold_devcontainer('testproject', Path(self.tmpdir), config=config)
 
         dockerfile = Path(self.tmpdir) / '.devcontainer' / 'Dockerfile'
         content = dockerfile.read_text()
@@ -209,13 +300,12 @@ class TestTemplateSystem(unittest.TestCase):
 
     def test_scaffold_warns_if_exists(self):
         """Should warn but not error if .devcontainer exists."""
-        os.chdir(self.tmpdir)
         devcontainer_dir = Path(self.tmpdir) / '.devcontainer'
         devcontainer_dir.mkdir()
         (devcontainer_dir / 'devcontainer.json').write_text('existing')
 
         # Should not raise, should return False (not created)
-        result = jolo.scaffold_devcontainer('testproject')
+        result = jolo.scaffold_devcontainer('testproject', Path(self.tmpdir))
         self.assertFalse(result)
 
         # Original file should be preserved
@@ -223,6 +313,13 @@ class TestTemplateSystem(unittest.TestCase):
         self.assertEqual(content, 'existing')
 
 
+# `pass show` output per pass path, for the default pass_path_* config
+_PASS_RESPONSES = {
+    'api/llm/anthropic': 'sk-ant-from-pass\n',
+    'api/llm/openai': 'sk-openai-from-pass\n',
+}
+
+
 class TestSecretsManagement(unittest.TestCase):
     """Test secrets fetching from pass and environment."""
 
@@ -242,13 +339,8 @@ class TestSecretsManagement(unittest.TestCase):
     def test_get_secrets_from_pass(self):
         """Should get secrets from pass when available."""
         def mock_run(cmd, *args, **kwargs):
-            result = mock.Mock()
-            result.returncode = 0
-            if 'api/llm/anthropic' in cmd:
-                result.stdout = 'sk-ant-from-pass\n'
-            elif 'api/llm/openai' in cmd:
-                result.stdout = 'sk-openai-from-pass\n'
-            return result
+            # cmd is ['pass', 'show', <pass path>]
+            return _completed(0, _PASS_RESPONSES.get(cmd[-1], ''))
 
         with mock.patch('shutil.which', return_value='/usr/bin/pass'):
             with mock.patch('subprocess.run', side_effect=mock_run):
@@ -295,13 +387,11 @@ class TestModeValidation(unittest.TestCase):
     """Test validation for different modes."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory(dir=_TMPROOT))
         self.original_cwd = os.getcwd()
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-        shutil.rmtree(self.tmpdir)
 
     def test_tree_mode_requires_git_repo(self):
         """--tree should fail if not in git repo."""
@@ -309,7 +399,7 @@ class TestModeValidation(unittest.TestCase):
 
         with self.assertRaises(SystemExit) as cm:
             jolo.validate_tree_mode()
-        self.assertIn('git', str(cm.exception.code).lower())
+        self.assertRegex(str(cm.exception.code), _GIT_PAT)
 
     def test_create_mode_forbids_git_repo(self):
         """--create should fail if already in git repo."""
@@ -319,7 +409,7 @@ class TestModeValidation(unittest.TestCase):
 
         with self.assertRaises(SystemExit) as cm:
             jolo.validate_create_mode('newproject')
-        self.assertIn('git', str(cm.exception.code).lower())
+        self.assertRegex(str(cm.exception.code), _GIT_PAT)
 
     def test_create_mode_forbids_existing_directory(self):
         """--create should fail if directory exists."""
@@ -329,7 +419,7 @@ class TestModeValidation(unittest.TestCase):
 
         with self.assertRaises(SystemExit) as cm:
             jolo.validate_create_mode('existing')
-        self.assertIn('exists', str(cm.exception.code).lower())
+        self.assertRegex(str(cm.exception.code), _EXISTS_PAT)
 
 
 class TestWorktreeExists(unittest.TestCase):
@@ -339,7 +429,7 @@ class TestWorktreeExists(unittest.TestCase):
         """Should return existing worktree path instead of erroring."""
         # If worktree exists, get_or_create_worktree should return the path
         # without trying to create it
-        with tempfile.TemporaryDirectory() as tmpdir:
+        with tempfile.TemporaryDirectory(dir=_TMPROOT) as tmpdir:
             worktree_path = Path(tmpdir) / 'existing-worktree'
             worktree_path.mkdir()
             (worktree_path / '.devcontainer').mkdir()
@@ -358,18 +448,10 @@ class TestWorktreeDevcontainer(unittest.TestCase):
     """Test worktree-specific devcontainer configuration."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-
-    def tearDown(self):
-        os.chdir(self.original_cwd)
-        import shutil
-        shutil.rmtree(self.tmpdir)
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory(dir=_TMPROOT))
 
     def test_add_git_mount_to_devcontainer(self):
         """Should add mount for main repo .git directory."""
-        import json
-
         # Create a devcontainer.json
         devcontainer_dir = Path(self.tmpdir) / '.devcontainer'
         devcontainer_dir.mkdir()
@@ -396,8 +478,6 @@ class TestWorktreeDevcontainer(unittest.TestCase):
 
     def test_add_git_mount_creates_mounts_array(self):
         """Should create mounts array if not present."""
-        import json
-
         devcontainer_dir = Path(self.tmpdir) / '.devcontainer'
         devcontainer_dir.mkdir()
         json_file = devcontainer_dir / 'devcontainer.json'
@@ -412,22 +492,79 @@ class TestWorktreeDevcontainer(unittest.TestCase):
         self.assertIn('mounts', updated)
         self.assertEqual(len(updated['mounts']), 1)
 
+    def test_new_worktree_copy_leaves_main_devcontainer_untouched(self):
+        """Editing the worktree's copied devcontainer.json must not affect main's."""
+        git_root = Path(self.tmpdir) / 'proj'
+        init_committed_repo(git_root)
+        main_json = git_root / '.devcontainer' / 'devcontainer.json'
+        main_json.parent.mkdir()
+        main_json.write_text(json.dumps({"name": "proj"}))
+
+        worktree_path = Path(self.tmpdir) / 'proj-worktrees' / 'feature'
+        jolo.get_or_create_worktree(git_root, 'feature', worktree_path)
+
+        self.assertEqual(json.loads(main_json.read_text()), {"name": "proj"})
+        copied = json.loads((worktree_path / '.devcontainer' / 'devcontainer.json').read_text())
+        self.assertEqual(len(copied['mounts']), 1)
+
+    def test_existing_worktree_gets_user_mounts(self):
+        """User mounts passed to get_or_create_worktree land in devcontainer.json."""
+        worktree_path = Path(self.tmpdir) / 'existing'
+        devcontainer_dir = worktree_path / '.devcontainer'
+        devcontainer_dir.mkdir(parents=True)
+        json_file = devcontainer_dir / 'devcontainer.json'
+        json_file.write_text(json.dumps({"name": "test"}))
+
+        mounts = [{"source": "/data", "target": "/workspaces/existing/data", "readonly": True}]
+        jolo.get_or_create_worktree(
+            git_root=Path(self.tmpdir),
+            worktree_name='existing',
+            worktree_path=worktree_path,
+            mounts=mounts,
+        )
+
+        updated = json.loads(json_file.read_text())
+        self.assertEqual(
+            updated['mounts'],
+            ["source=/data,target=/workspaces/existing/data,type=bind,readonly"],
+        )
+
+    def test_existing_worktree_gets_container_env_in_same_write(self):
+        """container_env should be merged into containerEnv alongside user mounts."""
+        worktree_path = Path(self.tmpdir) / 'existing'
+        devcontainer_dir = worktree_path / '.devcontainer'
+        devcontainer_dir.mkdir(parents=True)
+        json_file = devcontainer_dir / 'devcontainer.json'
+        json_file.write_text(json.dumps({"name": "test", "containerEnv": {"TERM": "xterm"}}))
+
+        mounts = [{"source": "/data", "target": "/workspaces/existing/data", "readonly": False}]
+        with mock.patch('json.dump', wraps=json.dump) as mock_dump:
+            jolo.get_or_create_worktree(
+                git_root=Path(self.tmpdir),
+                worktree_name='existing',
+                worktree_path=worktree_path,
+                mounts=mounts,
+                container_env={"PORT": "4001"},
+            )
+
+        mock_dump.assert_called_once()
+        updated = json.loads(json_file.read_text())
+        self.assertEqual(updated['containerEnv'], {"TERM": "xterm", "PORT": "4001"})
+        self.assertEqual(updated['mounts'], ["source=/data,target=/workspaces/existing/data,type=bind"])
+
 
 class TestSyncDevcontainer(unittest.TestCase):
     """Test --sync functionality."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory(dir=_TMPROOT))
         self.original_cwd = os.getcwd()
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-        shutil.rmtree(self.tmpdir)
 
     def test_sync_overwrites_existing_devcontainer(self):
         """--sync should regenerate .devcontainer even if it exists."""
-        os.chdir(self.tmpdir)
 
         # Create existing .devcontainer with old content
         devcontainer_dir = Path(self.tmpdir) / '.devcontainer'
@@ -437,7 +574,7 @@ class TestSyncDevcontainer(unittest.TestCase):
 
         # Sync with new config
         config = {'base_image': 'new/image:v2'}
-        jolo.sync_devcontainer('myproject', config=config)
+        jolo.sync_devcontainer('myproject', Path(self.tmpdir), config=config)
 
         # Verify new content
         dockerfile = (devcontainer_dir / 'Dockerfile').read_text()
@@ -464,18 +601,15 @@ class TestConfigLoading(unittest.TestCase):
     """Test TOML configuration loading."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory(dir=_TMPROOT))
         self.original_cwd = os.getcwd()
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-        shutil.rmtree(self.tmpdir)
 
     def test_load_config_returns_defaults_when_no_files(self):
         """Should return default config when no config files exist."""
-        os.chdir(self.tmpdir)
-        config = jolo.load_config(global_config_dir=Path(self.tmpdir) / 'noexist')
+        config = jolo.load_config(global_config_dir=Path(self.tmpdir) / 'noexist', project_dir=Path(self.tmpdir))
 
         self.assertEqual(config['base_image'], 'localhost/emacs-gui:latest')
         self.assertEqual(config['pass_path_anthropic'], 'api/llm/anthropic')
@@ -487,7 +621,7 @@ class TestConfigLoading(unittest.TestCase):
         config_dir.mkdir(parents=True)
         (config_dir / 'config.toml').write_text('base_image = "custom/image:v1"\n')
 
-        config = jolo.load_config(global_config_dir=config_dir)
+        config = jolo.load_config(global_config_dir=config_dir, project_dir=Path(self.tmpdir))
 
         self.assertEqual(config['base_image'], 'custom/image:v1')
 
@@ -506,10 +640,9 @@ class TestConfigLoading(unittest.TestCase):
         config_dir.mkdir(parents=True)
         (config_dir / 'config.toml').write_text('base_image = "global/image:v1"\n')
 
-        os.chdir(self.tmpdir)
         Path(self.tmpdir, '.jolo.toml').write_text('base_image = "project/image:v2"\n')
 
-        config = jolo.load_config(global_config_dir=config_dir)
+        config = jolo.load_config(global_config_dir=config_dir, project_dir=Path(self.tmpdir))
 
         self.assertEqual(config['base_image'], 'project/image:v2')
 
@@ -521,10 +654,9 @@ class TestConfigLoading(unittest.TestCase):
             'base_image = "global/image:v1"\npass_path_anthropic = "custom/path"\n'
         )
 
-        os.chdir(self.tmpdir)
         Path(self.tmpdir, '.jolo.toml').write_text('base_image = "project/image:v2"\n')
 
-        config = jolo.load_config(global_config_dir=config_dir)
+        config = jolo.load_config(global_config_dir=config_dir, project_dir=Path(self.tmpdir))
 
         self.assertEqual(config['base_image'], 'project/image:v2')
         self.assertEqual(config['pass_path_anthropic'], 'custom/path')
@@ -540,7 +672,7 @@ class TestListMode(unittest.TestCase):
 
     def test_list_default_false(self):
         """--list should default to False."""
-        args = jolo.parse_args([])
+        args = default_args()
         self.assertFalse(args.list)
 
     def test_all_flag(self):
@@ -558,36 +690,61 @@ class TestListMode(unittest.TestCase):
         args = jolo.parse_args(['--list'])
         self.assertFalse(args.all)
 
+    def test_list_uses_single_container_listing(self):
+        """--list should mark running workspaces from one listing, without exec probes."""
+        with tempfile.TemporaryDirectory(dir=_TMPROOT) as tmpdir:
+            git_root = Path(tmpdir) / 'proj'
+            wt = Path(tmpdir) / 'proj-worktrees' / 'feature'
+            for path in (git_root, wt):
+                (path / '.devcontainer').mkdir(parents=True)
+            containers = [
+                ('proj', str(git_root), 'exited'),
+                ('feature', str(wt), 'running'),
+            ]
+            with mock.patch('jolo.find_git_root', return_value=git_root), \
+                    mock.patch('jolo.find_project_workspaces',
+                               return_value=[(git_root, 'main'), (wt, 'feature')]), \
+                    mock.patch('jolo.list_all_devcontainers', return_value=containers), \
+                    mock.patch('jolo.list_worktrees', return_value=[]), \
+                    mock.patch('jolo.is_container_running') as mock_probe, \
+                    mock.patch('builtins.print') as mock_print:
+                jolo.run_list_mode(jolo.parse_args(['--list']))
+
+            mock_probe.assert_not_called()
+            printed = [c.args[0] for c in mock_print.call_args_list if c.args]
+            self.assertIn(f"  * {'feature':<20} {'running':<10} (feature)", printed)
+            self.assertIn(f"    {'proj':<20} {'stopped':<10} (main)", printed)
+
+    def test_find_project_workspaces_reuses_given_listing(self):
+        """A precomputed worktree listing should not trigger another git call."""
+        with tempfile.TemporaryDirectory(dir=_TMPROOT) as tmpdir:
+            git_root = Path(tmpdir) / 'proj'
+            wt = Path(tmpdir) / 'proj-worktrees' / 'feature'
+            wt.mkdir(parents=True)
+            listing = [(git_root, 'abc123', 'main'), (wt, 'def456', 'feature')]
+
+            with mock.patch('jolo.list_worktrees') as mock_list:
+                workspaces = jolo.find_project_workspaces(git_root, worktrees=listing)
+
+            mock_list.assert_not_called()
+            self.assertEqual(workspaces, [(git_root, 'main'), (wt, 'feature')])
+
 
 class TestListWorktrees(unittest.TestCase):
     """Test worktree listing functionality."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-
-    def tearDown(self):
-        os.chdir(self.original_cwd)
-        import shutil
-        shutil.rmtree(self.tmpdir)
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory(dir=_TMPROOT))
 
     def test_list_worktrees_empty_on_non_git(self):
         """Should return empty list for non-git directory."""
-        os.chdir(self.tmpdir)
         result = jolo.list_worktrees(Path(self.tmpdir))
         self.assertEqual(result, [])
 
     def test_list_worktrees_returns_main_repo(self):
         """Should return main repo as first worktree."""
-        os.chdir(self.tmpdir)
-        import subprocess
-        subprocess.run(['git', 'init'], cwd=self.tmpdir, capture_output=True)
-        # Create an initial commit so git worktree list works
-        subprocess.run(['git', 'config', 'user.email', 'test@test.com'], cwd=self.tmpdir, capture_output=True)
-        subprocess.run(['git', 'config', 'user.name', 'Test'], cwd=self.tmpdir, capture_output=True)
-        Path(self.tmpdir, 'README').write_text('test')
-        subprocess.run(['git', 'add', '.'], cwd=self.tmpdir, capture_output=True)
-        subprocess.run(['git', 'commit', '-m', 'Initial'], cwd=self.tmpdir, capture_output=True)
+        # Needs an initial commit so git worktree list works
+        init_committed_repo(self.tmpdir)
 
         result = jolo.list_worktrees(Path(self.tmpdir))
 
@@ -596,8 +753,6 @@ class TestListWorktrees(unittest.TestCase):
 
     def test_find_project_workspaces_includes_main(self):
         """Should always include main repo in workspaces."""
-        os.chdir(self.tmpdir)
-        import subprocess
         subprocess.run(['git', 'init'], cwd=self.tmpdir, capture_output=True)
 
         git_root = Path(self.tmpdir)
@@ -611,6 +766,11 @@ class TestListWorktrees(unittest.TestCase):
 class TestContainerRuntime(unittest.TestCase):
     """Test container runtime detection."""
 
+    def setUp(self):
+        # get_container_runtime is cached; isolate each test's PATH mock
+        jolo.get_container_runtime.cache_clear()
+        self.addCleanup(jolo.get_container_runtime.cache_clear)
+
     def test_get_container_runtime_finds_docker(self):
         """Should detect docker if available."""
         with mock.patch('shutil.which') as mock_which:
@@ -638,6 +798,13 @@ class TestContainerRuntime(unittest.TestCase):
             result = jolo.get_container_runtime()
             self.assertIsNone(result)
 
+    def test_get_container_runtime_probes_path_once(self):
+        """Repeated calls should reuse the first PATH lookup."""
+        with mock.patch('shutil.which', return_value='/usr/bin/docker') as mock_which:
+            jolo.get_container_runtime()
+            jolo.get_container_runtime()
+            self.assertEqual(mock_which.call_count, 1)
+
 
 class TestListAllDevcontainers(unittest.TestCase):
     """Test global devcontainer listing."""
@@ -650,14 +817,88 @@ class TestListAllDevcontainers(unittest.TestCase):
 
     def test_list_all_parses_docker_output(self):
         """Should parse docker ps output correctly."""
-        mock_output = "mycontainer\t/home/user/project\trunning\n"
-        with mock.patch('jolo.get_container_runtime', return_value='docker'):
+        mock_output = "mycontainer\x1f/home/user/project\x1frunning\n"
+        with mock.patch('jolo.get_container_runtime', return_value='docker'), \
+                mock.patch('jolo.engine_socket_path', return_value=None):
             with mock.patch('subprocess.run') as mock_run:
-                mock_run.return_value = mock.Mock(returncode=0, stdout=mock_output)
+                mock_run.return_value = _completed(0, mock_output)
                 result = jolo.list_all_devcontainers()
                 self.assertEqual(len(result), 1)
                 self.assertEqual(result[0], ('mycontainer', '/home/user/project', 'running'))
 
+    def test_list_all_queries_engine_socket(self):
+        """Should read containers from the engine API socket without spawning the CLI."""
+
+        body = json.dumps([
+            {"Names": ["/mycontainer"], "State": "running",
+             "Labels": {"devcontainer.local_folder": "/home/user/project"}},
+        ]).encode()
+        requests = []
+
+        with tempfile.TemporaryDirectory(dir=_TMPROOT) as tmpdir:
+            sock_path = os.path.join(tmpdir, 'docker.sock')
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.bind(sock_path)
+            server.listen(1)
+
+            def serve():
+                conn, _ = server.accept()
+                with conn:
+                    requests.append(conn.recv(65536).decode())
+                    conn.sendall(
+                        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                        b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+                    )
+
+            thread = threading.Thread(target=serve)
+            thread.start()
+            try:
+                env = {'DOCKER_HOST': f'unix://{sock_path}', 'DOCKER_CONFIG': tmpdir}
+                with mock.patch('jolo.get_container_runtime', return_value='docker'), \
+                        mock.patch.dict(os.environ, env), \
+                        mock.patch('subprocess.run') as mock_run:
+                    os.environ.pop('DOCKER_CONTEXT', None)
+                    result = jolo.list_all_devcontainers()
+            finally:
+                thread.join()
+                server.close()
+
+        self.assertEqual(result, [('mycontainer', '/home/user/project', 'running')])
+        self.assertTrue(requests[0].startswith('GET /containers/json?all=1&filters='))
+        mock_run.assert_not_called()
+
+    def test_engine_socket_path_skips_remote_hosts(self):
+        """Remote DOCKER_HOST values should leave listing to the CLI."""
+        with mock.patch.dict(os.environ, {'DOCKER_HOST': 'ssh://user@host'}):
+            self.assertIsNone(jolo.engine_socket_path('docker'))
+
+    def test_engine_socket_path_requires_explicit_host(self):
+        """Without DOCKER_HOST there is no socket to guess; use the CLI."""
+        with mock.patch.dict(os.environ, {'DOCKER_CONTEXT': 'default'}):
+            os.environ.pop('DOCKER_HOST', None)
+            self.assertIsNone(jolo.engine_socket_path('docker'))
+
+    def test_engine_socket_path_skips_active_docker_context(self):
+        """A DOCKER_CONTEXT may point at another daemon than DOCKER_HOST's socket."""
+        env = {'DOCKER_HOST': 'unix:///run/docker.sock', 'DOCKER_CONTEXT': 'rootless'}
+        with mock.patch.dict(os.environ, env), \
+                mock.patch('jolo._engine_api_get') as mock_get, \
+                mock.patch('jolo.get_container_runtime', return_value='docker'), \
+                mock.patch('subprocess.run', return_value=_completed(0, '')) as mock_run:
+            self.assertIsNone(jolo.engine_socket_path('docker'))
+            jolo.list_all_devcontainers()
+        mock_get.assert_not_called()
+        self.assertEqual(mock_run.call_args[0][0][:2], ['docker', 'ps'])
+
+    def test_engine_socket_path_skips_current_context_in_config(self):
+        """currentContext in the docker CLI config counts as an active context."""
+        with tempfile.TemporaryDirectory(dir=_TMPROOT) as tmpdir:
+            Path(tmpdir, 'config.json').write_text(json.dumps({'currentContext': 'desktop-linux'}))
+            env = {'DOCKER_HOST': 'unix:///run/docker.sock', 'DOCKER_CONFIG': tmpdir}
+            with mock.patch.dict(os.environ, env):
+                os.environ.pop('DOCKER_CONTEXT', None)
+                self.assertIsNone(jolo.engine_socket_path('docker'))
+
 
 class TestStopMode(unittest.TestCase):
     """Test --stop functionality."""
@@ -669,60 +910,98 @@ class TestStopMode(unittest.TestCase):
 
     def test_stop_default_false(self):
         """--stop should default to False."""
-        args = jolo.parse_args([])
+        args = default_args()
         self.assertFalse(args.stop)
 
-
+    def test_stop_all_uses_single_container_listing(self):
+        """--stop --all should stop running containers by name from one listing."""
+        with tempfile.TemporaryDirectory(dir=_TMPROOT) as tmpdir:
+            git_root = Path(tmpdir)
+            containers = [
+                ('proj', str(git_root), 'running'),
+                ('other', '/elsewhere', 'running'),
+            ]
+            with mock.patch('jolo.find_git_root', return_value=git_root), \
+                    mock.patch('jolo.find_project_workspaces', return_value=[(git_root, 'main')]), \
+                    mock.patch('jolo.list_all_devcontainers', return_value=containers), \
+                    mock.patch('jolo.get_container_for_workspace') as mock_lookup, \
+                    mock.patch('jolo.stop_container', return_value=True) as mock_stop:
+                jolo.run_stop_mode(jolo.parse_args(['--stop', '--all']))
+
+            mock_stop.assert_called_once_with(git_root, container_name='proj')
+            mock_lookup.assert_not_called()
+
+    def test_stop_all_stops_worktrees_before_main(self):
+        """--stop --all should stop every running worktree, then main last."""
+        with tempfile.TemporaryDirectory(dir=_TMPROOT) as tmpdir:
+            git_root = Path(tmpdir) / 'proj'
+            wt_a = Path(tmpdir) / 'proj-worktrees' / 'a'
+            wt_b = Path(tmpdir) / 'proj-worktrees' / 'b'
+            for path in (git_root, wt_a, wt_b):
+                path.mkdir(parents=True)
+            containers = [
+                ('proj', str(git_root), 'running'),
+                ('a', str(wt_a), 'running'),
+                ('b', str(wt_b), 'exited'),
+            ]
+            workspaces = [(git_root, 'main'), (wt_a, 'a'), (wt_b, 'b')]
+            with mock.patch('jolo.find_git_root', return_value=git_root), \
+                    mock.patch('jolo.find_project_workspaces', return_value=workspaces), \
+                    mock.patch('jolo.list_all_devcontainers', return_value=containers), \
+                    mock.patch('jolo.stop_container', return_value=True) as mock_stop:
+                jolo.run_stop_mode(jolo.parse_args(['--stop', '--all']))
+
+            self.assertEqual(mock_stop.call_args_list, [
+                mock.call(wt_a, container_name='a'),
+                mock.call(git_root, container_name='proj'),
+            ])
+
+
+@mock.patch('jolo.get_container_runtime', return_value='docker')
 class TestGetContainerForWorkspace(unittest.TestCase):
     """Test container lookup by workspace."""
 
-    def test_returns_none_without_runtime(self):
+    def test_returns_none_without_runtime(self, mock_runtime):
         """Should return None if no container runtime."""
-        with mock.patch('jolo.get_container_runtime', return_value=None):
-            result = jolo.get_container_for_workspace(Path('/some/path'))
-            self.assertIsNone(result)
+        mock_runtime.return_value = None
+        result = jolo.get_container_for_workspace(Path('/some/path'))
+        self.assertIsNone(result)
 
-    def test_returns_container_name(self):
+    @mock.patch('subprocess.run', return_value=_completed(0, 'my-container\n'))
+    def test_returns_container_name(self, mock_run, mock_runtime):
         """Should return container name from docker output."""
-        with mock.patch('jolo.get_container_runtime', return_value='docker'):
-            with mock.patch('subprocess.run') as mock_run:
-                mock_run.return_value = mock.Mock(returncode=0, stdout='my-container\n')
-                result = jolo.get_container_for_workspace(Path('/home/user/project'))
-                self.assertEqual(result, 'my-container')
+        result = jolo.get_container_for_workspace(Path('/home/user/project'))
+        self.assertEqual(result, 'my-container')
 
-    def test_returns_none_when_no_container(self):
+    @mock.patch('subprocess.run', return_value=_completed(0, ''))
+    def test_returns_none_when_no_container(self, mock_run, mock_runtime):
         """Should return None when no container found."""
-        with mock.patch('jolo.get_container_runtime', return_value='docker'):
-            with mock.patch('subprocess.run') as mock_run:
-                mock_run.return_value = mock.Mock(returncode=0, stdout='')
-                result = jolo.get_container_for_workspace(Path('/home/user/project'))
-                self.assertIsNone(result)
+        result = jolo.get_container_for_workspace(Path('/home/user/project'))
+        self.assertIsNone(result)
 
 
+@mock.patch('jolo.get_container_runtime', return_value='docker')
 class TestStopContainer(unittest.TestCase):
     """Test container stopping."""
 
-    def test_stop_returns_false_without_runtime(self):
+    def test_stop_returns_false_without_runtime(self, mock_runtime):
         """Should return False if no container runtime."""
-        with mock.patch('jolo.get_container_runtime', return_value=None):
-            result = jolo.stop_container(Path('/some/path'))
-            self.assertFalse(result)
+        mock_runtime.return_value = None
+        result = jolo.stop_container(Path('/some/path'))
+        self.assertFalse(result)
 
-    def test_stop_returns_false_when_no_container(self):
+    @mock.patch('jolo.get_container_for_workspace', return_value=None)
+    def test_stop_returns_false_when_no_container(self, mock_lookup, mock_runtime):
         """Should return False when no container found."""
-        with mock.patch('jolo.get_container_runtime', return_value='docker'):
-            with mock.patch('jolo.get_container_for_workspace', return_value=None):
-                result = jolo.stop_container(Path('/some/path'))
-                self.assertFalse(result)
+        result = jolo.stop_container(Path('/some/path'))
+        self.assertFalse(result)
 
-    def test_stop_returns_true_on_success(self):
+    @mock.patch('subprocess.run', return_value=_completed(0))
+    @mock.patch('jolo.get_container_for_workspace', return_value='my-container')
+    def test_stop_returns_true_on_success(self, mock_lookup, mock_run, mock_runtime):
         """Should return True when container stopped successfully."""
-        with mock.patch('jolo.get_container_runtime', return_value='docker'):
-            with mock.patch('jolo.get_container_for_workspace', return_value='my-container'):
-                with mock.patch('subprocess.run') as mock_run:
-                    mock_run.return_value = mock.Mock(returncode=0)
-                    result = jolo.stop_container(Path('/some/path'))
-                    self.assertTrue(result)
+        result = jolo.stop_container(Path('/some/path'))
+        self.assertTrue(result)
 
 
 class TestPruneMode(unittest.TestCase):
@@ -735,7 +1014,7 @@ class TestPruneMode(unittest.TestCase):
 
     def test_prune_default_false(self):
         """--prune should default to False."""
-        args = jolo.parse_args([])
+        args = default_args()
         self.assertFalse(args.prune)
 
 
@@ -743,45 +1022,31 @@ class TestFindStaleWorktrees(unittest.TestCase):
     """Test stale worktree detection."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-
-    def tearDown(self):
-        os.chdir(self.original_cwd)
-        import shutil
-        shutil.rmtree(self.tmpdir)
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory(dir=_TMPROOT))
 
     def test_find_stale_worktrees_returns_empty_for_fresh_repo(self):
         """Should return empty list when no stale worktrees."""
-        os.chdir(self.tmpdir)
-        import subprocess
-        subprocess.run(['git', 'init'], cwd=self.tmpdir, capture_output=True)
-        subprocess.run(['git', 'config', 'user.email', 'test@test.com'], cwd=self.tmpdir, capture_output=True)
-        subprocess.run(['git', 'config', 'user.name', 'Test'], cwd=self.tmpdir, capture_output=True)
-        Path(self.tmpdir, 'README').write_text('test')
-        subprocess.run(['git', 'add', '.'], cwd=self.tmpdir, capture_output=True)
-        subprocess.run(['git', 'commit', '-m', 'Initial'], cwd=self.tmpdir, capture_output=True)
+        init_committed_repo(self.tmpdir)
 
         result = jolo.find_stale_worktrees(Path(self.tmpdir))
         self.assertEqual(result, [])
 
 
+@mock.patch('jolo.get_container_runtime', return_value='docker')
 class TestRemoveContainer(unittest.TestCase):
     """Test container removal."""
 
-    def test_remove_returns_false_without_runtime(self):
+    def test_remove_returns_false_without_runtime(self, mock_runtime):
         """Should return False if no container runtime."""
-        with mock.patch('jolo.get_container_runtime', return_value=None):
-            result = jolo.remove_container('my-container')
-            self.assertFalse(result)
+        mock_runtime.return_value = None
+        result = jolo.remove_container('my-container')
+        self.assertFalse(result)
 
-    def test_remove_returns_true_on_success(self):
+    @mock.patch('subprocess.run', return_value=_completed(0))
+    def test_remove_returns_true_on_success(self, mock_run, mock_runtime):
         """Should return True when container removed successfully."""
-        with mock.patch('jolo.get_container_runtime', return_value='docker'):
-            with mock.patch('subprocess.run') as mock_run:
-                mock_run.return_value = mock.Mock(returncode=0)
-                result = jolo.remove_container('my-container')
-                self.assertTrue(result)
+        result = jolo.remove_container('my-container')
+        self.assertTrue(result)
 
 
 class TestRemoveWorktree(unittest.TestCase):
@@ -790,7 +1055,7 @@ class TestRemoveWorktree(unittest.TestCase):
     def test_remove_worktree_calls_git(self):
         """Should call git worktree remove."""
         with mock.patch('subprocess.run') as mock_run:
-            mock_run.return_value = mock.Mock(returncode=0)
+            mock_run.return_value = _completed(0)
             result = jolo.remove_worktree(Path('/project'), Path('/project-worktrees/foo'))
             self.assertTrue(result)
             mock_run.assert_called_once()
@@ -809,7 +1074,7 @@ class TestAttachMode(unittest.TestCase):
 
     def test_attach_default_false(self):
         """--attach should default to False."""
-        args = jolo.parse_args([])
+        args = default_args()
         self.assertFalse(args.attach)
 
 
@@ -828,7 +1093,7 @@ class TestDetachMode(unittest.TestCase):
 
     def test_detach_default_false(self):
         """--detach should default to False."""
-        args = jolo.parse_args([])
+        args = default_args()
         self.assertFalse(args.detach)
 
     def test_detach_with_tree(self):
@@ -861,22 +1126,11 @@ class TestFromBranch(unittest.TestCase):
 class TestBranchExists(unittest.TestCase):
     """Test branch existence checking."""
 
-    def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        # Set up a git repo with a commit
-        import subprocess
-        subprocess.run(['git', 'init'], cwd=self.tmpdir, capture_output=True)
-        subprocess.run(['git', 'config', 'user.email', 'test@test.com'], cwd=self.tmpdir, capture_output=True)
-        subprocess.run(['git', 'config', 'user.name', 'Test'], cwd=self.tmpdir, capture_output=True)
-        Path(self.tmpdir, 'README').write_text('test')
-        subprocess.run(['git', 'add', '.'], cwd=self.tmpdir, capture_output=True)
-        subprocess.run(['git', 'commit', '-m', 'Initial'], cwd=self.tmpdir, capture_output=True)
-
-    def tearDown(self):
-        os.chdir(self.original_cwd)
-        import shutil
-        shutil.rmtree(self.tmpdir)
+    @classmethod
+    def setUpClass(cls):
+        # branch_exists only reads the repo, so one copy serves every test
+        cls.tmpdir = cls.enterClassContext(tempfile.TemporaryDirectory(dir=_TMPROOT))
+        init_committed_repo(cls.tmpdir)
 
     def test_branch_exists_for_existing_branch(self):
         """Should return True for existing branch."""
@@ -904,7 +1158,7 @@ class TestVerboseMode(unittest.TestCase):
 
     def test_verbose_default_false(self):
         """--verbose should default to False."""
-        args = jolo.parse_args([])
+        args = default_args()
         self.assertFalse(args.verbose)
 
 
@@ -918,7 +1172,7 @@ class TestSpawnArgParsing(unittest.TestCase):
 
     def test_spawn_default_none(self):
         """--spawn should default to None."""
-        args = jolo.parse_args([])
+        args = default_args()
         self.assertIsNone(args.spawn)
 
     def test_spawn_with_prefix(self):
@@ -935,7 +1189,7 @@ class TestSpawnArgParsing(unittest.TestCase):
 
     def test_prefix_default_none(self):
         """--prefix should default to None."""
-        args = jolo.parse_args([])
+        args = default_args()
         self.assertIsNone(args.prefix)
 
 
@@ -1000,14 +1254,12 @@ class TestPortAllocation(unittest.TestCase):
 
     def test_default_port_in_json(self):
         """Default port should be 4000."""
-        import json
         result = jolo.build_devcontainer_json('test')
         config = json.loads(result)
         self.assertEqual(config['containerEnv']['PORT'], '4000')
 
     def test_custom_port_in_json(self):
         """Custom port should be set."""
-        import json
         result = jolo.build_devcontainer_json('test', port=4005)
         config = json.loads(result)
         self.assertEqual(config['containerEnv']['PORT'], '4005')
@@ -1016,50 +1268,42 @@ class TestPortAllocation(unittest.TestCase):
 class TestMountArgParsing(unittest.TestCase):
     """Test --mount argument parsing."""
 
-    def test_mount_flag_single(self):
-        """--mount should accept source:target."""
-        args = jolo.parse_args(['--mount', '~/data:data'])
-        self.assertEqual(args.mount, ['~/data:data'])
-
-    def test_mount_flag_multiple(self):
-        """--mount can be specified multiple times."""
-        args = jolo.parse_args(['--mount', '~/a:a', '--mount', '~/b:b'])
-        self.assertEqual(args.mount, ['~/a:a', '~/b:b'])
+    def test_mount_flag_values(self):
+        """--mount accepts source:target[:ro] and may be repeated."""
+        cases = [
+            (['--mount', '~/data:data'], ['~/data:data']),
+            (['--mount', '~/a:a', '--mount', '~/b:b'], ['~/a:a', '~/b:b']),
+            (['--mount', '~/data:data:ro'], ['~/data:data:ro']),
+        ]
+        for argv, expected in cases:
+            with self.subTest(argv=argv):
+                self.assertEqual(jolo.parse_args(argv).mount, expected)
 
     def test_mount_default_empty(self):
         """--mount should default to empty list."""
-        args = jolo.parse_args([])
+        args = default_args()
         self.assertEqual(args.mount, [])
 
-    def test_mount_readonly(self):
-        """--mount should accept :ro suffix."""
-        args = jolo.parse_args(['--mount', '~/data:data:ro'])
-        self.assertEqual(args.mount, ['~/data:data:ro'])
-
 
 class TestCopyArgParsing(unittest.TestCase):
     """Test --copy argument parsing."""
 
-    def test_copy_flag_single(self):
-        """--copy should accept source:target."""
-        args = jolo.parse_args(['--copy', '~/config.json:config.json'])
-        self.assertEqual(args.copy, ['~/config.json:config.json'])
-
-    def test_copy_flag_multiple(self):
-        """--copy can be specified multiple times."""
-        args = jolo.parse_args(['--copy', '~/a.json', '--copy', '~/b.json:b.json'])
-        self.assertEqual(args.copy, ['~/a.json', '~/b.json:b.json'])
+    def test_copy_flag_values(self):
+        """--copy accepts source[:target] and may be repeated."""
+        cases = [
+            (['--copy', '~/config.json:config.json'], ['~/config.json:config.json']),
+            (['--copy', '~/a.json', '--copy', '~/b.json:b.json'], ['~/a.json', '~/b.json:b.json']),
+            (['--copy', '~/config.json'], ['~/config.json']),
+        ]
+        for argv, expected in cases:
+            with self.subTest(argv=argv):
+                self.assertEqual(jolo.parse_args(argv).copy, expected)
 
     def test_copy_default_empty(self):
         """--copy should default to empty list."""
-        args = jolo.parse_args([])
+        args = default_args()
         self.assertEqual(args.copy, [])
 
-    def test_copy_without_target(self):
-        """--copy should accept source without target."""
-        args = jolo.parse_args(['--copy', '~/config.json'])
-        self.assertEqual(args.copy, ['~/config.json'])
-
 
 class TestMountAndCopyTogether(unittest.TestCase):
     """Test --mount and --copy used together."""
@@ -1081,28 +1325,20 @@ class TestMountAndCopyTogether(unittest.TestCase):
 class TestMountParsing(unittest.TestCase):
     """Test parse_mount() function."""
 
-    def test_parse_mount_relative_target(self):
-        """Relative target should resolve to workspace."""
-        result = jolo.parse_mount('~/data:foo', 'myproj')
-        self.assertEqual(result['target'], '/workspaces/myproj/foo')
-        self.assertFalse(result['readonly'])
-
-    def test_parse_mount_absolute_target(self):
-        """Absolute target should be used as-is."""
-        result = jolo.parse_mount('~/data:/mnt/data', 'myproj')
-        self.assertEqual(result['target'], '/mnt/data')
-
-    def test_parse_mount_readonly(self):
-        """:ro suffix should set readonly."""
-        result = jolo.parse_mount('~/data:foo:ro', 'myproj')
-        self.assertTrue(result['readonly'])
-        self.assertEqual(result['target'], '/workspaces/myproj/foo')
-
-    def test_parse_mount_absolute_readonly(self):
-        """Absolute target with :ro suffix."""
-        result = jolo.parse_mount('~/data:/mnt/data:ro', 'myproj')
-        self.assertTrue(result['readonly'])
-        self.assertEqual(result['target'], '/mnt/data')
+    def test_parse_mount_target_and_mode(self):
+        """Relative targets resolve to the workspace; :ro sets readonly."""
+        cases = [
+            ('~/data:foo', '/workspaces/myproj/foo', False),
+            ('~/data:/mnt/data', '/mnt/data', False),
+            ('~/data:foo:ro', '/workspaces/myproj/foo', True),
+            ('~/data:/mnt/data:ro', '/mnt/data', True),
+            ('~/data:some/nested/path', '/workspaces/myproj/some/nested/path', False),
+        ]
+        for spec, target, readonly in cases:
+            with self.subTest(spec=spec):
+                result = jolo.parse_mount(spec, 'myproj')
+                self.assertEqual(result['target'], target)
+                self.assertIs(result['readonly'], readonly)
 
     def test_parse_mount_expands_tilde(self):
         """Should expand ~ in source path."""
@@ -1110,34 +1346,21 @@ class TestMountParsing(unittest.TestCase):
         self.assertNotIn('~', result['source'])
         self.assertTrue(result['source'].startswith('/'))
 
-    def test_parse_mount_default_readwrite(self):
-        """Default should be read-write."""
-        result = jolo.parse_mount('~/data:foo', 'myproj')
-        self.assertFalse(result['readonly'])
-
-    def test_parse_mount_nested_target(self):
-        """Nested relative target should work."""
-        result = jolo.parse_mount('~/data:some/nested/path', 'myproj')
-        self.assertEqual(result['target'], '/workspaces/myproj/some/nested/path')
-
 
 class TestCopyParsing(unittest.TestCase):
     """Test parse_copy() function."""
 
-    def test_parse_copy_with_target(self):
-        """Copy with target should resolve correctly."""
-        result = jolo.parse_copy('~/config.json:app/config.json', 'myproj')
-        self.assertEqual(result['target'], '/workspaces/myproj/app/config.json')
-
-    def test_parse_copy_basename_only(self):
-        """Copy without target should use basename."""
-        result = jolo.parse_copy('~/config.json', 'myproj')
-        self.assertEqual(result['target'], '/workspaces/myproj/config.json')
-
-    def test_parse_copy_absolute_target(self):
-        """Copy with absolute target should use as-is."""
-        result = jolo.parse_copy('~/config.json:/tmp/config.json', 'myproj')
-        self.assertEqual(result['target'], '/tmp/config.json')
+    def test_parse_copy_target(self):
+        """Targets resolve to the workspace, defaulting to the basename."""
+        cases = [
+            ('~/config.json:app/config.json', '/workspaces/myproj/app/config.json'),
+            ('~/config.json', '/workspaces/myproj/config.json'),
+            ('~/config.json:/tmp/config.json', '/tmp/config.json'),
+            ('~/some/nested/config.json', '/workspaces/myproj/config.json'),
+        ]
+        for spec, target in cases:
+            with self.subTest(spec=spec):
+                self.assertEqual(jolo.parse_copy(spec, 'myproj')['target'], target)
 
     def test_parse_copy_expands_tilde(self):
         """Should expand ~ in source path."""
@@ -1146,28 +1369,24 @@ class TestCopyParsing(unittest.TestCase):
         self.assertTrue(result['source'].startswith('/'))
 
     def test_parse_copy_nested_source(self):
-        """Nested source path should work."""
+        """Nested source path should be kept in full."""
         result = jolo.parse_copy('~/some/nested/config.json', 'myproj')
-        self.assertEqual(result['target'], '/workspaces/myproj/config.json')
         self.assertTrue(result['source'].endswith('some/nested/config.json'))
 
 
 class TestAddUserMounts(unittest.TestCase):
     """Test add_user_mounts() function."""
 
-    def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
+    @classmethod
+    def setUpClass(cls):
+        cls.root = cls.enterClassContext(tempfile.TemporaryDirectory(dir=_TMPROOT))
 
-    def tearDown(self):
-        os.chdir(self.original_cwd)
-        import shutil
-        shutil.rmtree(self.tmpdir)
+    def setUp(self):
+        self.tmpdir = os.path.join(self.root, self._testMethodName)
+        os.mkdir(self.tmpdir)
 
     def test_add_user_mounts_to_devcontainer_json(self):
         """Mount should be added to mounts array in JSON."""
-        import json
-
         # Create devcontainer.json
         devcontainer_dir = Path(self.tmpdir) / '.devcontainer'
         devcontainer_dir.mkdir()
@@ -1187,57 +1406,34 @@ class TestAddUserMounts(unittest.TestCase):
 
     def test_mount_readonly_format(self):
         """Readonly mount should include ,readonly in mount string."""
-        import json
-
-        devcontainer_dir = Path(self.tmpdir) / '.devcontainer'
-        devcontainer_dir.mkdir()
-        json_file = devcontainer_dir / 'devcontainer.json'
-        json_file.write_text(json.dumps({"name": "test", "mounts": []}))
-
-        mounts = [{"source": "/data", "target": "/mnt", "readonly": True}]
-        jolo.add_user_mounts(json_file, mounts)
-
-        content = json.loads(json_file.read_text())
-        self.assertIn(',readonly', content['mounts'][0])
+        mount = jolo.format_user_mount({"source": "/data", "target": "/mnt", "readonly": True})
+        self.assertIn(',readonly', mount)
 
     def test_multiple_mounts_in_json(self):
         """Multiple mounts should all be added."""
-        import json
-
-        devcontainer_dir = Path(self.tmpdir) / '.devcontainer'
-        devcontainer_dir.mkdir()
-        json_file = devcontainer_dir / 'devcontainer.json'
-        json_file.write_text(json.dumps({"name": "test", "mounts": ["existing"]}))
-
         mounts = [
             {"source": "/a", "target": "/mnt/a", "readonly": False},
             {"source": "/b", "target": "/mnt/b", "readonly": True},
         ]
-        jolo.add_user_mounts(json_file, mounts)
-
-        content = json.loads(json_file.read_text())
+        content = jolo.merge_devcontainer_edits(
+            {"name": "test", "mounts": ["existing"]}, [jolo.format_user_mount(m) for m in mounts]
+        )
         self.assertEqual(len(content['mounts']), 3)  # existing + 2 new
 
     def test_add_user_mounts_creates_mounts_array(self):
         """Should create mounts array if not present."""
-        import json
-
-        devcontainer_dir = Path(self.tmpdir) / '.devcontainer'
-        devcontainer_dir.mkdir()
-        json_file = devcontainer_dir / 'devcontainer.json'
-        json_file.write_text(json.dumps({"name": "test"}))
+        content = jolo.merge_devcontainer_edits({"name": "test"}, ["source=/data,target=/mnt,type=bind"])
+        self.assertEqual(content['mounts'], ["source=/data,target=/mnt,type=bind"])
 
-        mounts = [{"source": "/data", "target": "/mnt", "readonly": False}]
-        jolo.add_user_mounts(json_file, mounts)
-
-        content = json.loads(json_file.read_text())
-        self.assertIn('mounts', content)
-        self.assertEqual(len(content['mounts']), 1)
+    def test_merge_sets_container_env(self):
+        """containerEnv should be created or updated alongside mounts."""
+        content = jolo.merge_devcontainer_edits(
+            {"containerEnv": {"A": "1"}}, [], {"PORT": "4001"}
+        )
+        self.assertEqual(content, {"containerEnv": {"A": "1", "PORT": "4001"}})
 
     def test_add_user_mounts_empty_list(self):
         """Empty mounts list should not modify file."""
-        import json
-
         devcontainer_dir = Path(self.tmpdir) / '.devcontainer'
         devcontainer_dir.mkdir()
         json_file = devcontainer_dir / 'devcontainer.json'
@@ -1317,14 +1513,13 @@ class TestPreCommitTemplate(unittest.TestCase):
 class TestCopyUserFiles(unittest.TestCase):
     """Test copy_user_files() function."""
 
-    def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
+    @classmethod
+    def setUpClass(cls):
+        cls.root = cls.enterClassContext(tempfile.TemporaryDirectory(dir=_TMPROOT))
 
-    def tearDown(self):
-        os.chdir(self.original_cwd)
-        import shutil
-        shutil.rmtree(self.tmpdir)
+    def setUp(self):
+        self.tmpdir = os.path.join(self.root, self._testMethodName)
+        os.mkdir(self.tmpdir)
 
     def test_file_copied_to_correct_location(self):
         """File should be copied to target location."""
@@ -1386,6 +1581,370 @@ class TestCopyUserFiles(unittest.TestCase):
         self.assertTrue((workspace / 'a.json').exists())
         self.assertTrue((workspace / 'b.json').exists())
 
+    def test_directory_target_gets_source_name(self):
+        """Copying onto an existing directory should place the file inside it."""
+        workspace = Path(self.tmpdir) / 'workspace'
+        (workspace / 'conf').mkdir(parents=True)
+        source = Path(self.tmpdir) / 'app.json'
+        source.write_text('x')
+
+        copies = [{"source": str(source), "target": "/workspaces/myproj/conf"}]
+        with mock.patch('jolo.reflink_copy', wraps=jolo.reflink_copy) as mock_copy:
+            jolo.copy_user_files(copies, workspace)
+
+        target = workspace / 'conf' / 'app.json'
+        mock_copy.assert_called_once_with(str(source), str(target))
+        self.assertEqual(target.read_text(), 'x')
+
+
+class TestClearDirectoryContents(unittest.TestCase):
+    """Test clear_directory_contents() function."""
+
+    def setUp(self):
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory(dir=_TMPROOT))
+
+    def test_removes_files_and_dirs_keeps_root(self):
+        """Files and subdirectories go, the directory itself stays."""
+        target = Path(self.tmpdir) / 'target'
+        (target / 'sub' / 'deep').mkdir(parents=True)
+        (target / 'sub' / 'deep' / 'f.txt').write_text('x')
+        (target / 'top.txt').write_text('y')
+
+        jolo.clear_directory_contents(target)
+
+        self.assertTrue(target.is_dir())
+        self.assertEqual(list(target.iterdir()), [])
+
+    def test_symlink_to_dir_is_unlinked_not_followed(self):
+        """A symlinked directory should be removed without touching its target."""
+        outside = Path(self.tmpdir) / 'outside'
+        outside.mkdir()
+        (outside / 'keep.txt').write_text('keep')
+        target = Path(self.tmpdir) / 'target'
+        target.mkdir()
+        (target / 'link').symlink_to(outside)
+
+        jolo.clear_directory_contents(target)
+
+        self.assertEqual(list(target.iterdir()), [])
+        self.assertTrue((outside / 'keep.txt').exists())
+
+    def test_missing_directory_is_noop(self):
+        """Nonexistent path should not raise."""
+        jolo.clear_directory_contents(Path(self.tmpdir) / 'nope')
+
+
+class TestReflinkCopy(unittest.TestCase):
+    """Test reflink_copy() function."""
+
+    def setUp(self):
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory(dir=_TMPROOT))
+
+    def test_copies_content_as_independent_file(self):
+        """Copy should have same content but never share an inode with source."""
+        src = Path(self.tmpdir) / 'init.el'
+        src.write_text('(setq x 1)')
+        dst = Path(self.tmpdir) / 'copy.el'
+
+        jolo.reflink_copy(str(src), str(dst))
+
+        self.assertEqual(dst.read_text(), '(setq x 1)')
+        self.assertNotEqual(src.stat().st_ino, dst.stat().st_ino)
+        dst.write_text('changed')
+        self.assertEqual(src.read_text(), '(setq x 1)')
+
+    def test_falls_back_when_clone_unsupported(self):
+        """If the clone ioctl fails, should still copy via copy2."""
+        src = Path(self.tmpdir) / 'init.el'
+        src.write_text('data')
+        dst = Path(self.tmpdir) / 'copy.el'
+
+        with mock.patch('jolo._REFLINK_SUPPORTED', True), \
+                mock.patch('fcntl.ioctl', side_effect=OSError(errno.EOPNOTSUPP, 'Not supported')):
+            jolo.reflink_copy(str(src), str(dst))
+            self.assertFalse(jolo._REFLINK_SUPPORTED)
+
+        self.assertEqual(dst.read_text(), 'data')
+
+    def test_per_file_error_keeps_reflinks_enabled(self):
+        """Errors unrelated to clone support should not turn reflinks off."""
+        src = Path(self.tmpdir) / 'init.el'
+        src.write_text('data')
+        dst_dir = Path(self.tmpdir) / 'out'
+        dst_dir.mkdir()
+
+        with mock.patch('jolo._REFLINK_SUPPORTED', True):
+            jolo.reflink_copy(str(src), str(dst_dir))
+            self.assertTrue(jolo._REFLINK_SUPPORTED)
+
+        self.assertEqual((dst_dir / 'init.el').read_text(), 'data')
+
+
+class TestCopyIfChanged(unittest.TestCase):
+    """Test _copy_if_changed() function."""
+
+    def setUp(self):
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory(dir=_TMPROOT))
+
+    def test_copies_when_destination_missing(self):
+        """Should copy when dst does not exist yet."""
+        src = Path(self.tmpdir) / 'AGENTS.md'
+        src.write_text('rules')
+        dst = Path(self.tmpdir) / 'out.md'
+
+        self.assertTrue(jolo._copy_if_changed(src, dst))
+        self.assertEqual(dst.read_text(), 'rules')
+
+    def test_skips_unchanged_copy(self):
+        """Should not rewrite a dst left by a previous copy."""
+        src = Path(self.tmpdir) / 'AGENTS.md'
+        src.write_text('rules')
+        dst = Path(self.tmpdir) / 'out.md'
+        jolo._copy_if_changed(src, dst)
+
+        with mock.patch('shutil.copy2') as mock_copy:
+            self.assertFalse(jolo._copy_if_changed(src, dst))
+        mock_copy.assert_not_called()
+
+    def test_copies_when_source_changed(self):
+        """Should copy again once src differs from dst."""
+        src = Path(self.tmpdir) / 'AGENTS.md'
+        src.write_text('rules')
+        dst = Path(self.tmpdir) / 'out.md'
+        jolo._copy_if_changed(src, dst)
+        src.write_text('new rules')
+
+        self.assertTrue(jolo._copy_if_changed(src, dst))
+        self.assertEqual(dst.read_text(), 'new rules')
+
+
+class TestFastRmtree(unittest.TestCase):
+    """Test _fast_rmtree() function."""
+
+    def setUp(self):
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory(dir=_TMPROOT))
+
+    def _make_tree(self):
+        root = Path(self.tmpdir) / 'project'
+        (root / 'node_modules' / 'pkg').mkdir(parents=True)
+        (root / 'node_modules' / 'pkg' / 'index.js').write_text('x')
+        (root / 'README.md').write_text('readme')
+        return root
+
+    def test_removes_nested_tree(self):
+        """Should delete the directory and everything under it."""
+        root = self._make_tree()
+
+        jolo._fast_rmtree(root)
+
+        self.assertFalse(root.exists())
+
+    def test_falls_back_when_rm_missing(self):
+        """Should use shutil.rmtree if rm cannot be executed."""
+        root = self._make_tree()
+
+        with mock.patch('jolo.subprocess.run', side_effect=FileNotFoundError):
+            jolo._fast_rmtree(root)
+
+        self.assertFalse(root.exists())
+
+    def test_raises_when_rm_fails(self):
+        """A failing rm should surface as OSError with its stderr."""
+        root = self._make_tree()
+        failed = _completed(1, stderr='rm: permission denied\n')
+
+        with mock.patch('jolo.subprocess.run', return_value=failed):
+            with self.assertRaisesRegex(OSError, 'permission denied'):
+                jolo._fast_rmtree(root)
+
+
+class TestRunQuiet(unittest.TestCase):
+    """Test _run_quiet() function."""
+
+    def test_discards_output_without_pipes(self):
+        """Should send output to DEVNULL and return the exit status."""
+        with mock.patch('jolo.subprocess.run', return_value=_completed(3)) as mock_run:
+            status = jolo._run_quiet(['git', 'worktree', 'prune'], cwd=Path('/repo'))
+
+        self.assertEqual(status, 3)
+        mock_run.assert_called_once_with(
+            ['git', 'worktree', 'prune'],
+            cwd=Path('/repo'),
+            stdout=jolo.subprocess.DEVNULL,
+            stderr=jolo.subprocess.DEVNULL,
+        )
+
+
+class TestRunTmuxCommands(unittest.TestCase):
+    """Test run_tmux_commands() function."""
+
+    def test_chains_commands_into_one_invocation(self):
+        """Commands should be joined with ';' arguments into a single tmux call."""
+        with mock.patch('jolo.subprocess.run') as mock_run:
+            jolo.run_tmux_commands([
+                ['new-session', '-d', '-s', 'spawn', '-n', 'a'],
+                ['send-keys', '-t', 'spawn:a', 'claude "hi"', 'Enter'],
+            ])
+
+        mock_run.assert_called_once_with([
+            'tmux', 'new-session', '-d', '-s', 'spawn', '-n', 'a',
+            ';', 'send-keys', '-t', 'spawn:a', 'claude "hi"', 'Enter',
+        ])
+
+    def test_runs_separately_when_argument_ends_with_semicolon(self):
+        """An argument ending in ';' would split the chain, so run one by one."""
+        with mock.patch('jolo.subprocess.run') as mock_run:
+            jolo.run_tmux_commands([
+                ['new-window', '-t', 'spawn', '-n', 'b'],
+                ['send-keys', '-t', 'spawn:b', 'make;', 'Enter'],
+            ])
+
+        self.assertEqual(mock_run.call_args_list, [
+            mock.call(['tmux', 'new-window', '-t', 'spawn', '-n', 'b']),
+            mock.call(['tmux', 'send-keys', '-t', 'spawn:b', 'make;', 'Enter']),
+        ])
+
+    def test_failed_chain_is_reported_not_replayed(self):
+        """A failing chain returns tmux's status without re-running commands."""
+        with mock.patch('jolo.subprocess.run', return_value=_completed(1)) as mock_run:
+            status = jolo.run_tmux_commands([
+                ['new-session', '-d', '-s', 'spawn', '-n', 'a'],
+                ['new-window', '-t', 'spawn', '-n', 'b'],
+            ])
+
+        self.assertEqual(status, 1)
+        mock_run.assert_called_once()
+
+
+class TestTailLines(unittest.TestCase):
+    """Test tail_lines() function."""
+
+    def test_returns_last_non_blank_lines(self):
+        """Should keep only the final lines, skipping blank ones."""
+        with tempfile.TemporaryDirectory(dir=_TMPROOT) as tmpdir:
+            log = Path(tmpdir) / 'up.log'
+            log.write_text('\n'.join(f'line {i}' for i in range(100)) + '\n\n')
+
+            self.assertEqual(jolo.tail_lines(log, 3), ['line 97', 'line 98', 'line 99'])
+
+    def test_reads_only_the_end_of_large_files(self):
+        """Lines cut off by the read window should be dropped, not shown partially."""
+        with tempfile.TemporaryDirectory(dir=_TMPROOT) as tmpdir:
+            log = Path(tmpdir) / 'up.log'
+            log.write_text('x' * 100 + '\nlast one\n')
+
+            self.assertEqual(jolo.tail_lines(log, 5, max_bytes=20), ['last one'])
+
+
+class TestSetupEmacsConfig(unittest.TestCase):
+    """Test setup_emacs_config() copy skipping."""
+
+    def setUp(self):
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory(dir=_TMPROOT))
+        self.home = Path(self.tmpdir) / 'home'
+        self.emacs_src = self.home / '.config' / 'emacs'
+        self.emacs_src.mkdir(parents=True)
+        (self.emacs_src / 'init.el').write_text('(setq a 1)')
+        self.workspace = Path(self.tmpdir) / 'project'
+        (self.workspace / '.devcontainer').mkdir(parents=True)
+        patcher = mock.patch('jolo._HOME', self.home)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_unchanged_config_is_not_copied_again(self):
+        """A second run with the same host config should skip the copy."""
+        jolo.setup_emacs_config(self.workspace)
+
+        with mock.patch('shutil.copytree') as mock_copy:
+            jolo.setup_emacs_config(self.workspace)
+        mock_copy.assert_not_called()
+
+    def test_edited_config_is_copied_again(self):
+        """Editing a file in the host config should refresh the copy."""
+        jolo.setup_emacs_config(self.workspace)
+        init_el = self.emacs_src / 'init.el'
+        init_el.write_text('(setq a 2)')
+        os.utime(init_el, ns=(init_el.stat().st_mtime_ns + 10**9,) * 2)
+
+        jolo.setup_emacs_config(self.workspace)
+
+        copied = self.workspace / '.devcontainer' / '.emacs-config' / 'init.el'
+        self.assertEqual(copied.read_text(), '(setq a 2)')
+
+    def test_edited_copy_is_restored(self):
+        """Changes made to the copy (e.g. from the container) should be undone."""
+        jolo.setup_emacs_config(self.workspace)
+        copy_dir = self.workspace / '.devcontainer' / '.emacs-config'
+        (copy_dir / 'init.el').unlink()
+        (copy_dir / 'extra.el').write_text('(setq b 1)')
+
+        jolo.setup_emacs_config(self.workspace)
+
+        self.assertEqual((copy_dir / 'init.el').read_text(), '(setq a 1)')
+        self.assertFalse((copy_dir / 'extra.el').exists())
+
+
+class TestEnsureFile(unittest.TestCase):
+    """Test ensure_file() function."""
+
+    def setUp(self):
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory(dir=_TMPROOT))
+
+    def test_creates_missing_file(self):
+        """Should create an empty regular file."""
+        path = Path(self.tmpdir) / '.histfile'
+
+        jolo.ensure_file(path)
+
+        self.assertTrue(path.is_file())
+        self.assertEqual(path.read_text(), '')
+
+    def test_leaves_existing_file_untouched(self):
+        """Should keep content and mtime of an existing file."""
+        path = Path(self.tmpdir) / '.histfile'
+        path.write_text('ls -la\n')
+        os.utime(path, (1000000000, 1000000000))
+
+        jolo.ensure_file(path)
+
+        self.assertEqual(path.read_text(), 'ls -la\n')
+        self.assertEqual(path.stat().st_mtime, 1000000000)
+
+
+class TestDevcontainerExecCommand(unittest.TestCase):
+    """Test devcontainer_exec_command() argv construction."""
+
+    @classmethod
+    def setUpClass(cls):
+        # Only the argv matters here, so one patch serves the whole class
+        cls.mock_run = cls.enterClassContext(mock.patch('subprocess.run', return_value=_completed(0)))
+
+    def setUp(self):
+        self.mock_run.reset_mock()
+
+    def test_plain_command_skips_shell(self):
+        """A command without shell syntax should be exec'd as argv."""
+        jolo.devcontainer_exec_command(Path('/ws'), 'npm test')
+        cmd = self.mock_run.call_args[0][0]
+        self.assertEqual(cmd[-2:], ['npm', 'test'])
+        self.assertNotIn('sh', cmd)
+
+    def test_shell_syntax_uses_sh_c(self):
+        """Pipes, env vars etc. should still go through sh -c."""
+        for command in ['make && make test', 'echo $HOME', 'FOO=1 run', "echo 'hi'"]:
+            with self.subTest(command=command):
+                jolo.devcontainer_exec_command(Path('/ws'), command)
+                cmd = self.mock_run.call_args[0][0]
+                self.assertEqual(cmd[-3:], ['sh', '-c', command])
+
+    def test_shell_builtins_use_sh_c(self):
+        """Builtins like cd or export have no executable, so need sh -c."""
+        for command in ['cd /tmp', 'export FOO', 'ulimit -n', 'source env.sh', 'exit 1']:
+            with self.subTest(command=command):
+                jolo.devcontainer_exec_command(Path('/ws'), command)
+                cmd = self.mock_run.call_args[0][0]
+                self.assertEqual(cmd[-3:], ['sh', '-c', command])
+
 
 class TestLangArgParsing(unittest.TestCase):
     """Test --lang argument parsing."""
@@ -1407,7 +1966,7 @@ class TestLangArgParsing(unittest.TestCase):
 
     def test_lang_default_none(self):
         """--lang should default to None."""
-        args = jolo.parse_args([])
+        args = default_args()
         self.assertIsNone(args.lang)
 
     def test_lang_valid_values(self):
@@ -1982,7 +2541,6 @@ class TestGetTypeCheckerConfig(unittest.TestCase):
         self.assertIsInstance(result, dict)
         self.assertEqual(result['config_file'], 'tsconfig.json')
         # Content should be valid JSON with strict mode
-        import json
         config = json.loads(result['config_content'])
         self.assertIn('compilerOptions', config)
         self.assertTrue(config['compilerOptions'].get('strict'))
@@ -2029,7 +2587,6 @@ class TestGetTypeCheckerConfig(unittest.TestCase):
 
     def test_typescript_tsconfig_has_essential_options(self):
         """TypeScript config should have essential compiler options."""
-        import json
         result = jolo.get_type_checker_config('typescript')
         config = json.loads(result['config_content'])
         options = config['compilerOptions']
@@ -2250,14 +2807,12 @@ class TestCreateModeLanguageIntegration(unittest.TestCase):
     """Integration tests for run_create_mode() language handling."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory(dir=_TMPROOT))
         self.original_cwd = os.getcwd()
         os.chdir(self.tmpdir)
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-        shutil.rmtree(self.tmpdir)
 
     def _mock_devcontainer_calls(self):
         """Create mocks for devcontainer commands."""
@@ -2524,6 +3079,45 @@ class TestDestroyYesFlag(unittest.TestCase):
             jolo.run_destroy_mode(args)
             mock_input.assert_called_once()
 
+    @mock.patch("jolo.find_git_root")
+    @mock.patch("jolo.get_container_runtime")
+    @mock.patch("jolo.find_containers_for_project")
+    @mock.patch("jolo.subprocess.run")
+    @mock.patch("jolo.remove_container")
+    def test_destroy_stops_and_removes_every_container(
+        self,
+        mock_remove,
+        mock_run,
+        mock_find_containers,
+        mock_runtime,
+        mock_git_root,
+    ):
+        """Each container is stopped only if running, always removed, reported in order."""
+        mock_git_root.return_value = Path("/fake/project")
+        mock_runtime.return_value = "podman"
+        mock_find_containers.return_value = [
+            ("c1", "/fake/project", "running"),
+            ("c2", "/fake/project-worktrees/a", "exited"),
+            ("c3", "/fake/project-worktrees/b", "running"),
+        ]
+        mock_run.return_value = _completed(0)
+        mock_remove.return_value = True
+
+        args = jolo.parse_args(["--destroy", "--yes"])
+
+        with mock.patch("jolo._fast_rmtree"), \
+                mock.patch("builtins.print") as mock_print:
+            jolo.run_destroy_mode(args)
+
+        stopped = sorted(c.args[0][2] for c in mock_run.call_args_list if c.args[0][1] == "stop")
+        self.assertEqual(stopped, ["c1", "c3"])
+        self.assertEqual(sorted(c.args[0] for c in mock_remove.call_args_list), ["c1", "c2", "c3"])
+        printed = [c.args[0] for c in mock_print.call_args_list if c.args]
+        status = [line for line in printed if line.startswith(("Stopped:", "Removed:"))]
+        self.assertEqual(status[:5], [
+            "Stopped: c1", "Removed: c1", "Removed: c2", "Stopped: c3", "Removed: c3",
+        ])
+
 
 if __name__ == '__main__':
     unittest.main()